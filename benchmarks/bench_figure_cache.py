@@ -0,0 +1,77 @@
+"""
+Cold vs warm render time for the cached dashboard figures
+
+Measures the work done per rerun up to the point Streamlit has the figure
+spec: building the figure (cold) or reusing the cached one (warm), then the
+validation and encoding st.plotly_chart performs.
+
+Run from the repository root:
+    python -m benchmarks.bench_figure_cache [--states 36] [--repeats 20]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.tools
+import plotly.utils
+
+from codebase.dashboard_aggregates import DELIVERIES_COLUMN, STATE_COLUMN, get_aggregates
+from codebase.dashboard_charts import build_bubble_chart, build_pie_chart
+from codebase.dataset_cache import Dataset
+from codebase.figure_cache import get_figure
+
+CHARTS = {'bubble': build_bubble_chart, 'pie': build_pie_chart}
+
+
+def make_dataset(n_states, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        STATE_COLUMN: [f"State {i}" for i in range(n_states)],
+        DELIVERIES_COLUMN: rng.integers(1_000, 500_000, n_states),
+    })
+    return Dataset(df, f"bench-{n_states}", time.time())
+
+
+def streamlit_encode(figure):
+    """What st.plotly_chart does with the figure before sending it"""
+    figure = plotly.tools.return_figure_from_figure_or_data(figure, validate_figure=True)
+    return json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder)
+
+
+def render(dataset, chart):
+    state_totals = get_aggregates(dataset).state_totals
+    build = lambda **params: CHARTS[chart](state_totals, **params)
+    return streamlit_encode(get_figure(dataset, chart, build, height=600))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--states', type=int, default=36)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'chart':>8} {'cold ms':>10} {'warm ms':>10} {'speedup':>8}")
+    for chart in CHARTS:
+        cold = []
+        for i in range(args.repeats):
+            # A fresh dataset version has an empty figure cache
+            dataset = make_dataset(args.states, seed=i)
+            get_aggregates(dataset)
+            started = time.perf_counter()
+            render(dataset, chart)
+            cold.append(time.perf_counter() - started)
+
+        warm = []
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            render(dataset, chart)
+            warm.append(time.perf_counter() - started)
+
+        cold_ms, warm_ms = np.median(cold) * 1000, np.median(warm) * 1000
+        print(f"{chart:>8} {cold_ms:>10.2f} {warm_ms:>10.2f} {cold_ms / warm_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Query latency of the offline hospital index
+
+Uses randomly placed synthetic facilities (not real hospitals) and checks
+the results against brute-force haversine distances.
+
+Run from the repository root:
+    python -m benchmarks.bench_hospital_index [--facilities 300000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from codebase.hospital_index import EARTH_RADIUS_KM, HospitalIndex
+
+# Rough bounding box of India
+LAT_RANGE = (8.0, 35.0)
+LON_RANGE = (68.0, 97.0)
+
+
+def synthetic_facilities(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'name': pd.array([f"Facility {i}" for i in range(n)], dtype='string'),
+        'latitude': rng.uniform(*LAT_RANGE, n),
+        'longitude': rng.uniform(*LON_RANGE, n),
+    })
+
+
+def haversine_km(lat, lon, latitudes, longitudes):
+    lat, lon, latitudes, longitudes = map(np.radians, (lat, lon, latitudes, longitudes))
+    a = (np.sin((latitudes - lat) / 2) ** 2
+         + np.cos(lat) * np.cos(latitudes) * np.sin((longitudes - lon) / 2) ** 2)
+    return 2 * np.arcsin(np.sqrt(a)) * EARTH_RADIUS_KM
+
+
+def check(index, queries, k=5, radius_km=30):
+    for lat, lon in queries[:20]:
+        exact = haversine_km(lat, lon, index.coordinates[:, 0], index.coordinates[:, 1])
+        distances, indices = index.nearest_batch(lat, lon, k)
+        assert np.allclose(distances[0], np.sort(exact)[:k]), "nearest mismatch"
+        _, within = index.within_batch(lat, lon, radius_km)[0]
+        assert set(within.tolist()) == set(np.flatnonzero(exact <= radius_km).tolist()), "radius mismatch"
+
+
+def per_query_us(fn, n_queries, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best / n_queries * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark codebase.hospital_index")
+    parser.add_argument('--facilities', type=int, default=300_000)
+    parser.add_argument('--queries', type=int, default=10_000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = HospitalIndex(synthetic_facilities(args.facilities))
+    print(f"Indexed {len(index):,} facilities in {time.perf_counter() - started:.2f} s")
+
+    rng = np.random.default_rng(1)
+    queries = np.column_stack([rng.uniform(*LAT_RANGE, args.queries), rng.uniform(*LON_RANGE, args.queries)])
+    check(index, queries)
+    print("Results match brute-force haversine")
+
+    lat, lon = queries[0]
+    print(f"{'query':>24} {'us/query':>10}")
+    print(f"{'nearest k=5, single':>24} {per_query_us(lambda: index.nearest_batch(lat, lon, 5), 1):>10.1f}")
+    print(f"{'within 25 km, single':>24} {per_query_us(lambda: index.within_batch(lat, lon, 25), 1):>10.1f}")
+    print(f"{'nearest k=5, batch':>24} "
+          f"{per_query_us(lambda: index.nearest_batch(queries[:, 0], queries[:, 1], 5), len(queries)):>10.1f}")
+    print(f"{'within 25 km, batch':>24} "
+          f"{per_query_us(lambda: index.within_batch(queries[:, 0], queries[:, 1], 25), len(queries)):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
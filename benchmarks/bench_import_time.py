@@ -0,0 +1,115 @@
+"""
+Cold-start import cost of main.py and of each page's dependencies
+
+Every measurement runs in a fresh interpreter with `-X importtime` and sums
+the cumulative time of the top-level imports, minus what an empty
+interpreter imports on its own, so nothing is shared with an earlier run.
+Modules that are not installed are reported and skipped.
+
+Run from the repository root:
+    python -m benchmarks.bench_import_time [--repeats 9] [--output benchmarks/results/import_time.md]
+"""
+import argparse
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# What a new worker imports before rendering the login or Home page
+STARTUP = ['streamlit', 'database.database', 'codebase.user_cache', 'codebase.image_assets',
+           'codebase.tracing', 'codebase.lazy_imports', 'codebase.theme']
+
+# What main.py imported up front before the page imports were deferred
+EAGER_STARTUP = STARTUP + ['streamlit_option_menu', 'pandas', 'folium', 'streamlit_folium',
+                           'codebase.model_registry', 'codebase.batch_prediction',
+                           'codebase.inference_server', 'codebase.feature_schema',
+                           'codebase.prediction_cache', 'codebase.dataset_cache',
+                           'codebase.dashboard_aggregates', 'codebase.figure_cache',
+                           'codebase.dashboard_charts', 'codebase.pregnancy_calendar']
+
+# Deferred imports, in the order a page first needs them. scikit-learn is
+# not listed: models load from their .tables/ directories without it.
+PAGES = {
+    'Sidebar menu': ['streamlit_option_menu'],
+    'Home (calendar)': ['codebase.pregnancy_calendar'],
+    'Pregnancy Risk Prediction': ['codebase.model_registry', 'codebase.feature_schema',
+                                  'codebase.prediction_cache', 'codebase.batch_prediction',
+                                  'codebase.inference_server'],
+    'Fetal Health Prediction': ['codebase.model_registry', 'codebase.feature_schema',
+                                'codebase.prediction_cache', 'codebase.inference_server'],
+    'Dashboard': ['codebase.dataset_cache', 'codebase.dashboard_aggregates',
+                  'codebase.figure_cache', 'codebase.dashboard_charts'],
+    'Nearest Hospitals': ['codebase.hospital_index', 'codebase.hospital_map', 'codebase.map_cache'],
+}
+
+
+def is_installed(module):
+    probe = f"import importlib.util, sys; sys.exit(importlib.util.find_spec({module.split('.')[0]!r}) is None)"
+    return subprocess.run([sys.executable, '-c', probe]).returncode == 0
+
+
+def import_time_ms(modules):
+    """Returns (milliseconds, module count) to import modules in a fresh interpreter"""
+    code = "; ".join(f"import {module}" for module in modules) or "pass"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    total_us, count = 0, 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        count += 1
+        if not name[1:].startswith(' '):
+            total_us += int(cumulative)
+    return total_us / 1000, count
+
+
+def measure(modules, repeats, baseline=(0.0, 0)):
+    runs = [import_time_ms(modules) for _ in range(repeats)]
+    return (max(statistics.median(ms for ms, _ in runs) - baseline[0], 0.0),
+            runs[0][1] - baseline[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeats', type=int, default=9)
+    parser.add_argument('--output', help="Also write the report as Markdown to this file")
+    args = parser.parse_args()
+
+    installed = {module: is_installed(module)
+                 for module in set(EAGER_STARTUP).union(*PAGES.values())}
+    missing = sorted({module.split('.')[0] for module, ok in installed.items() if not ok})
+
+    baseline = measure([], args.repeats)
+    rows = []
+    for label, modules in [('Startup, all imports eager (before)', EAGER_STARTUP),
+                           ('Startup, page imports deferred (after)', STARTUP)]:
+        rows.append((label, *measure([m for m in modules if installed[m]], args.repeats, baseline)))
+    for page, modules in PAGES.items():
+        modules = [m for m in modules if installed[m]]
+        if modules:
+            rows.append((f"First visit: {page}", *measure(modules, args.repeats, baseline)))
+
+    lines = [
+        "# Import time report",
+        "",
+        f"Python {platform.python_version()} on {platform.system()}, median of {args.repeats} "
+        f"fresh interpreters (`-X importtime`, cumulative top-level imports).",
+        "",
+        "| Imports | ms | modules |",
+        "|---|---:|---:|",
+    ]
+    lines += [f"| {label} | {ms:.1f} | {count} |" for label, ms, count in rows]
+    if missing:
+        lines += ["", f"Not installed here, so not counted: {', '.join(missing)}."]
+    report = "\n".join(lines) + "\n"
+
+    print(report)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(report)
+
+
+if __name__ == "__main__":
+    main()
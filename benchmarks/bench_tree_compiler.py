@@ -0,0 +1,72 @@
+"""
+Microbenchmark for codebase.tree_compiler
+
+Parity with scikit-learn is covered by tests/test_tree_compiler.py.
+
+Run from the repository root:
+    python -m benchmarks.bench_tree_compiler [--max-rows 10000000]
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from codebase.model_registry import load_pickle
+from codebase.tree_compiler import compile_tree
+
+MODELS = {
+    'maternal': "model/finalized_maternal_model.sav",
+    'fetal': "model/fetal_health_classifier.sav",
+}
+BATCH_SIZES = [1, 1_000, 100_000, 10_000_000]
+
+
+def random_rows(model, n_rows, seed=0):
+    """Draws rows spread around every split threshold of the tree"""
+    rng = np.random.default_rng(seed)
+    tree = model.tree_
+    X = np.empty((n_rows, model.n_features_in_))
+    for f in range(model.n_features_in_):
+        thresholds = tree.threshold[tree.feature == f]
+        centre = thresholds.mean() if len(thresholds) else 0.0
+        spread = max(np.ptp(thresholds) if len(thresholds) else 1.0, 1.0)
+        X[:, f] = rng.normal(centre, spread, n_rows)
+    return X
+
+
+def time_per_row(fn, X, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(X)
+        best = min(best, time.perf_counter() - started)
+    return best / len(X)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-rows', type=int, default=max(BATCH_SIZES),
+                        help="Skip batch sizes above this many rows")
+    args = parser.parse_args()
+
+    for name, path in MODELS.items():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model = load_pickle(path)
+        compiled = compile_tree(model)
+        print(f"\n{name}: depth={compiled.depth} nodes={len(compiled.feature)}")
+        print(f"{'rows':>12} {'sklearn us/row':>16} {'numpy us/row':>14} {'speedup':>8}")
+
+        for n_rows in BATCH_SIZES:
+            if n_rows > args.max_rows:
+                continue
+            X = random_rows(model, n_rows)
+            repeats = 50 if n_rows <= 1_000 else 3 if n_rows <= 100_000 else 1
+            sk = time_per_row(model.predict, X, repeats)
+            np_ = time_per_row(compiled.predict, X, repeats)
+            print(f"{n_rows:>12,} {sk * 1e6:>16.3f} {np_ * 1e6:>14.3f} {sk / np_:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Batch scoring of clinic rosters with the maternal risk model
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+from codebase.feature_schema import MATERNAL_INPUTS, FeatureSchema, check_rows, select_columns
+from codebase.tracing import traced
+
+# Same column order as train_models.create_simple_maternal_model. Callers
+# with a loaded model pass its saved schema instead (validate.schema).
+MATERNAL_SCHEMA = FeatureSchema('maternal', MATERNAL_INPUTS)
+RISK_LABELS = {0: 'Low Risk', 1: 'Medium Risk', 2: 'High Risk'}
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def load_batch(source):
+    """
+    Returns a DataFrame from a DataFrame, a CSV path or an uploaded CSV file
+    """
+    if isinstance(source, pd.DataFrame):
+        return source
+    return pd.read_csv(source)
+
+
+def coerce_features(df, schema=MATERNAL_SCHEMA):
+    """
+    Converts the schema's feature columns to float64 in one vectorized pass
+    and checks them with the same rules as the form.
+
+    Returns (X, valid, errors) where X is a contiguous (n_rows, n_features)
+    array, valid a boolean mask of rows with every feature numeric and in
+    range, and errors the reason each invalid row was rejected ('' if valid).
+    Raises SchemaError (a ValueError) when a required column is missing.
+    """
+    numeric = select_columns(df, schema).apply(pd.to_numeric, errors='coerce')
+    X = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64))
+    valid, errors = check_rows(schema, X)
+    return X, valid, errors
+
+
+@traced("model.predict_batch")
+def predict_batch(model, source, chunk_size=DEFAULT_CHUNK_SIZE, schema=MATERNAL_SCHEMA):
+    """
+    Scores every valid row of source with model, calling predict and
+    predict_proba once per chunk of rows.
+
+    Returns the input frame with a prediction, label and one probability
+    column per class appended. Rows with missing, non-numeric or
+    out-of-range values get an empty prediction and the form's error message.
+    """
+    df = load_batch(source)
+    X, valid, errors = coerce_features(df, schema)
+
+    classes = list(model.classes_)
+    predictions = np.full(len(df), np.nan)
+    probabilities = np.full((len(df), len(classes)), np.nan)
+
+    valid_rows = np.flatnonzero(valid)
+    for start in range(0, len(valid_rows), chunk_size):
+        rows = valid_rows[start:start + chunk_size]
+        chunk = X[rows]
+        predictions[rows] = model.predict(chunk)
+        probabilities[rows] = model.predict_proba(chunk)
+
+    result = df.copy()
+    result['predicted_risk'] = pd.array(predictions, dtype='Int64')
+    result['risk_label'] = result['predicted_risk'].map(RISK_LABELS)
+    for i, cls in enumerate(classes):
+        result[f"probability_{RISK_LABELS.get(cls, str(cls)).lower().replace(' ', '_')}"] = probabilities[:, i]
+    result['error'] = errors
+    return result
+
+
+def to_csv_bytes(result):
+    """Returns the scored frame as UTF-8 CSV bytes for download"""
+    buffer = io.StringIO()
+    result.to_csv(buffer, index=False)
+    return buffer.getvalue().encode('utf-8')
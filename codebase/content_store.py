@@ -0,0 +1,98 @@
+"""
+Lazily loaded, versioned content files
+
+Content lives in data/content/<locale>/<name>.jsonl with one JSON object per
+line and a unique "key" field per object. Only the byte offsets of each key
+are indexed up front; a record is read from disk and parsed the first time
+it is requested and then kept in an LRU cache. The file's mtime is part of
+the cache key, so editing a file takes effect on the next lookup without
+reloading any Python module.
+"""
+import json
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+CONTENT_DIR = Path(__file__).parent.parent / "data" / "content"
+DEFAULT_LOCALE = "en"
+RECORD_CACHE_SIZE = 256
+
+_index_lock = threading.Lock()
+_indexes = {}
+
+
+def freeze(value):
+    """
+    Returns a read-only copy of nested content: dicts become mapping proxies
+    and lists become tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def content_path(name, locale=DEFAULT_LOCALE):
+    """Returns the content file for name, falling back to the default locale"""
+    path = CONTENT_DIR / locale / f"{name}.jsonl"
+    if locale != DEFAULT_LOCALE and not path.exists():
+        path = CONTENT_DIR / DEFAULT_LOCALE / f"{name}.jsonl"
+    return path
+
+
+def _build_index(path):
+    """Maps each record key to the (offset, length) of its line"""
+    index = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                index[json.loads(line)["key"]] = (offset, len(line))
+            offset += len(line)
+    return index
+
+
+def _file_index(path):
+    """Returns (mtime_ns, index) for path, re-indexing only after an edit"""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _indexes.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        with _index_lock:
+            cached = _indexes.get(path)
+            if cached is None or cached[0] != mtime_ns:
+                cached = _indexes[path] = (mtime_ns, _build_index(path))
+    return cached
+
+
+@lru_cache(maxsize=RECORD_CACHE_SIZE)
+def _load_record(path, mtime_ns, offset, length):
+    with open(path, "rb") as f:
+        f.seek(offset)
+        record = json.loads(f.read(length))
+    record.pop("key", None)
+    return freeze(record)
+
+
+def get_record(name, key, locale=DEFAULT_LOCALE, default=None):
+    """Returns the read-only record stored under key in content file name"""
+    path = str(content_path(name, locale))
+    mtime_ns, index = _file_index(path)
+    location = index.get(key)
+    if location is None:
+        return default
+    return _load_record(path, mtime_ns, *location)
+
+
+def get_keys(name, locale=DEFAULT_LOCALE):
+    """Returns the record keys of content file name in file order"""
+    return tuple(_file_index(str(content_path(name, locale)))[1])
+
+
+def clear_cache():
+    """Drops every indexed file and cached record"""
+    with _index_lock:
+        _indexes.clear()
+    _load_record.cache_clear()
@@ -0,0 +1,64 @@
+"""
+Aggregates behind the maternal health dashboard charts, computed once per
+dataset version
+"""
+import threading
+
+from codebase.dataset_cache import read_csv_chunked
+
+STATE_COLUMN = 'State/UT'
+DELIVERIES_COLUMN = 'Achievement during April to June - Total Institutional Deliveries - (2019-20) - (B)'
+NEED_COLUMN = 'Need Assessed (2019-20) - (A)'
+ACHIEVEMENT_COLUMN = '% Achvt of need assessed (2019-20) - (E=(B/A)*100)'
+# Every column charted by main.py and codebase/dashboard_graphs.py
+DASHBOARD_COLUMNS = [STATE_COLUMN, NEED_COLUMN, DELIVERIES_COLUMN, ACHIEVEMENT_COLUMN]
+TOP_N = 5
+
+_lock = threading.Lock()
+
+
+def parse_dashboard_csv(content):
+    """
+    DatasetCache parse step keeping only the charted columns, with State/UT
+    as category and the numeric columns downcast. Both dashboards load the
+    "maternal_dashboard" cache through it, so they share one snapshot.
+    """
+    return read_csv_chunked(content, DASHBOARD_COLUMNS,
+                            categories=[STATE_COLUMN], numeric=DASHBOARD_COLUMNS[1:])
+
+
+class DashboardAggregates:
+    """
+    state_totals: one row per state with the summed deliveries
+    percentages:  each state's share of all deliveries (%, 2 decimals)
+    top_states:   the TOP_N states by deliveries, largest first
+    """
+
+    __slots__ = ("state_totals", "percentages", "top_states")
+
+    def __init__(self, state_totals, percentages, top_states):
+        self.state_totals = state_totals
+        self.percentages = percentages
+        self.top_states = top_states
+
+
+def compute_aggregates(df, top_n=TOP_N):
+    totals = df.groupby(STATE_COLUMN, sort=True, observed=True)[DELIVERIES_COLUMN].sum()
+    percentages = (totals / totals.sum() * 100).round(2)
+    state_totals = totals.reset_index()
+    top_states = state_totals.nlargest(top_n, DELIVERIES_COLUMN).reset_index(drop=True)
+    return DashboardAggregates(state_totals, percentages, top_states)
+
+
+def get_aggregates(dataset):
+    """
+    Returns the aggregates for a loaded Dataset, computing them on first use
+    and keeping them with that dataset version
+    """
+    aggregates = dataset.derived.get('aggregates')
+    if aggregates is None:
+        with _lock:
+            aggregates = dataset.derived.get('aggregates')
+            if aggregates is None:
+                aggregates = dataset.derived['aggregates'] = compute_aggregates(dataset.df)
+    return aggregates
@@ -0,0 +1,52 @@
+"""
+Plotly figures for the maternal health dashboard
+"""
+import plotly.express as px
+
+
+def build_bubble_chart(state_totals, height=600):
+    """Bubble chart of institutional deliveries per state"""
+    fig = px.scatter(
+        state_totals,
+        x='State/UT',
+        y='Achievement during April to June - Total Institutional Deliveries - (2019-20) - (B)',
+        size='Achievement during April to June - Total Institutional Deliveries - (2019-20) - (B)',
+        color='Achievement during April to June - Total Institutional Deliveries - (2019-20) - (B)',
+        hover_name='State/UT',
+        title='Institutional Deliveries by State (2019-20)',
+        labels={
+            'State/UT': 'State',
+            'Achievement during April to June - Total Institutional Deliveries - (2019-20) - (B)': 'Number of Institutional Deliveries'
+        }
+    )
+
+    # Customize layout
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        showlegend=True,
+        height=height
+    )
+    return fig
+
+
+def build_pie_chart(state_totals, height=600):
+    """Pie chart of each state's share of institutional deliveries"""
+    fig = px.pie(
+        state_totals,
+        values='Achievement during April to June - Total Institutional Deliveries - (2019-20) - (B)',
+        names='State/UT',
+        title='Distribution of Institutional Deliveries by State (2019-20)',
+        hole=0.3
+    )
+
+    # Customize layout
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        showlegend=True,
+        height=height
+    )
+    return fig
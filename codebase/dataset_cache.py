@@ -0,0 +1,392 @@
+"""
+Cached, time-bounded loading of the dashboard dataset
+
+A DatasetCache keeps the parsed DataFrame in memory for `ttl` seconds and
+mirrors it to an on-disk snapshot so new processes start warm. Once the TTL
+expires the stale frame keeps being served while a background thread
+revalidates it against the source with ETag/Last-Modified headers.
+
+Sources return an open binary stream rather than the whole body, and the
+parse step reads from it directly. The content is hashed while it is
+read, so the raw file is never held in memory. read_csv_chunked is a
+parse step for large files: it reads the stream in chunks, keeps only
+the requested columns and stores them with compact dtypes (category for
+labels, the smallest numeric type that fits).
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from codebase.tracing import traced
+
+DEFAULT_TTL = 6 * 60 * 60
+SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "cache"
+CHUNK_ROWS = 100_000
+READ_BLOCK = 1 << 20
+# Seconds to wait after a failed background refresh before trying again
+RETRY_BACKOFF = 5 * 60
+
+
+class FetchResult:
+    """
+    An open binary stream of the source content, or stream=None when the
+    source is unchanged. Use as a context manager to close the stream.
+    """
+
+    __slots__ = ("stream", "etag", "last_modified")
+
+    def __init__(self, stream, etag=None, last_modified=None):
+        self.stream = stream
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.stream is not None:
+            self.stream.close()
+
+
+class HashingReader(io.RawIOBase):
+    """Read-only stream that hashes every byte read through it"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.raw.read(len(buffer))
+        self.sha256.update(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def drain(self):
+        """Reads (and hashes) whatever the parser left unread"""
+        while self.read(READ_BLOCK):
+            pass
+
+
+class HttpSource:
+    """Fetches a CSV over HTTP using conditional requests"""
+
+    def __init__(self, url, timeout=30):
+        self.url = url
+        self.timeout = timeout
+
+    @property
+    def identity(self):
+        return self.url
+
+    def fetch(self, etag=None, last_modified=None):
+        import requests
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        response = requests.get(self.url, headers=headers, timeout=self.timeout, stream=True)
+        if response.status_code == 304:
+            response.close()
+            return FetchResult(None, etag, last_modified)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+        # Undo any Content-Encoding (gzip) while streaming
+        response.raw.decode_content = True
+        return FetchResult(response.raw,
+                           response.headers.get('ETag'),
+                           response.headers.get('Last-Modified'))
+
+
+class FileSource:
+    """Reads a local CSV file; the file's mtime and size act as its ETag"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @property
+    def identity(self):
+        return str(self.path.resolve())
+
+    def fetch(self, etag=None, last_modified=None):
+        stat = self.path.stat()
+        file_etag = f"{stat.st_mtime_ns}-{stat.st_size}"
+        if etag == file_etag:
+            return FetchResult(None, etag, last_modified)
+        return FetchResult(open(self.path, 'rb'), file_etag, None)
+
+
+def parse_csv(stream):
+    return pd.read_csv(stream)
+
+
+def downcast_numeric(series):
+    """
+    Returns series in the smallest integer dtype when every value is a whole
+    number (nullable when some are missing), and as float32 otherwise
+    """
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast='integer')
+    present = series.dropna()
+    if len(present) and (present % 1 == 0).all():
+        if len(present) < len(series):
+            series = series.astype('Int64')
+        return pd.to_numeric(series, downcast='integer')
+    return pd.to_numeric(series, downcast='float')
+
+
+def read_csv_chunked(stream, columns, categories=(), numeric=(), chunksize=CHUNK_ROWS):
+    """
+    Parses a CSV stream chunksize rows at a time, keeping only `columns`.
+
+    `categories` are read as category, `numeric` as float64 and then
+    downcast, and every other column as string, so no dtype is inferred.
+    Each chunk is reduced to its projected, downcast columns as it arrives,
+    so memory grows with the compact result rather than with the file. Raises ValueError when a column
+    is missing from the header.
+    """
+    dtype = {column: 'category' if column in categories else 'float64' if column in numeric else 'string'
+             for column in columns}
+    parts = {column: [] for column in columns}
+    with pd.read_csv(stream, usecols=columns, dtype=dtype, chunksize=chunksize) as reader:
+        for chunk in reader:
+            for column in columns:
+                # Shrink each chunk as it arrives; dtypes are reconciled below
+                parts[column].append(downcast_numeric(chunk[column]) if column in numeric else chunk[column])
+
+    # Each chunk has its own categories, so category columns are unioned
+    # rather than concatenated (which would fall back to object)
+    data = {}
+    for column in columns:
+        if not parts[column]:
+            data[column] = pd.Series(dtype=dtype[column], name=column)
+        elif column in categories:
+            data[column] = pd.Series(union_categoricals(parts.pop(column), sort_categories=True), name=column)
+        else:
+            data[column] = pd.concat(parts.pop(column), ignore_index=True)
+    for column in numeric:
+        data[column] = downcast_numeric(data[column])
+    return pd.DataFrame(data, columns=columns)
+
+
+class Dataset:
+    """
+    An immutable loaded version of the dataset. `derived` holds results
+    computed from this version (aggregates, figures) so they are dropped
+    together with it.
+    """
+
+    __slots__ = ("df", "version", "fetched_at", "etag", "last_modified", "derived")
+
+    def __init__(self, df, version, fetched_at, etag=None, last_modified=None, derived=None):
+        self.df = df
+        self.version = version
+        self.fetched_at = fetched_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.derived = {} if derived is None else derived
+
+    def refreshed(self, fetched_at, etag, last_modified):
+        return Dataset(self.df, self.version, fetched_at, etag, last_modified, self.derived)
+
+
+class DatasetCache:
+    def __init__(self, name, source, ttl=DEFAULT_TTL, parse=parse_csv, snapshot_dir=SNAPSHOT_DIR):
+        self.name = name
+        self.source = source
+        self.ttl = ttl
+        self.parse = parse
+        # Hashed so API keys in the URL are not written to the metadata file
+        self.source_id = hashlib.sha256(source.identity.encode("utf-8")).hexdigest()[:16]
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        self._dataset = None
+        # _lock guards the fields below and is only held briefly;
+        # _fetch_lock lets one fetch run at a time without blocking readers
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+        self._failed_at = None
+
+    @traced("dataset.get")
+    def get(self):
+        """
+        Returns the current Dataset.
+
+        Only blocks on the source when nothing has been loaded yet, neither
+        in memory nor from a snapshot.
+        """
+        dataset = self._dataset
+        if dataset is None:
+            with self._fetch_lock:
+                dataset = self._dataset
+                if dataset is None:
+                    dataset = self._load_snapshot() or self._fetch(None)
+                    with self._lock:
+                        self._dataset = dataset
+
+        if time.time() - dataset.fetched_at > self.ttl:
+            self._revalidate_in_background()
+        return dataset
+
+    def refresh(self):
+        """Revalidates against the source now and returns the result"""
+        with self._fetch_lock:
+            dataset = self._fetch(self._dataset)
+            with self._lock:
+                self._dataset = dataset
+            return dataset
+
+    def _revalidate_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            if self._failed_at is not None and time.time() - self._failed_at < RETRY_BACKOFF:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+                self._failed_at = None
+            except Exception:
+                # Keep serving the stale copy; retry after RETRY_BACKOFF
+                self._failed_at = time.time()
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name=f"refresh-{self.name}", daemon=True).start()
+
+    @traced("dataset.fetch")
+    def _fetch(self, current):
+        etag = current.etag if current else None
+        last_modified = current.last_modified if current else None
+        with self.source.fetch(etag, last_modified) as result:
+            if result.stream is None and current is not None:
+                dataset = current.refreshed(time.time(), result.etag, result.last_modified)
+                self._write_metadata(dataset)
+                return dataset
+
+            # The version is the content hash, taken as the parser reads
+            hashing = HashingReader(result.stream)
+            df = self.parse(io.BufferedReader(hashing, READ_BLOCK))
+            hashing.drain()
+            version = hashing.sha256.hexdigest()[:16]
+        now = time.time()
+
+        if current is not None and current.version == version:
+            dataset = current.refreshed(now, result.etag, result.last_modified)
+            self._write_metadata(dataset)
+            return dataset
+
+        dataset = Dataset(df, version, now, result.etag, result.last_modified)
+        self._write_snapshot(dataset)
+        return dataset
+
+    # On-disk snapshot: Parquet when pyarrow is available, pickle otherwise,
+    # plus a JSON sidecar with the version and validators.
+
+    def _paths(self):
+        base = self.snapshot_dir / self.name
+        return base.with_suffix('.parquet'), base.with_suffix('.pkl'), base.with_suffix('.json')
+
+    def _parser(self):
+        # Snapshots written by a different parse step have other columns/dtypes
+        return f"{getattr(self.parse, '__module__', '')}.{getattr(self.parse, '__qualname__', repr(self.parse))}"
+
+    def _write_metadata(self, dataset):
+        if self.snapshot_dir is None:
+            return
+        meta_path = self._paths()[2]
+        tmp_path = meta_path.with_suffix('.json.tmp')
+        try:
+            tmp_path.write_text(json.dumps({
+                'version': dataset.version,
+                'parser': self._parser(),
+                'source': self.source_id,
+                'fetched_at': dataset.fetched_at,
+                'etag': dataset.etag,
+                'last_modified': dataset.last_modified,
+            }))
+            os.replace(tmp_path, meta_path)
+        except OSError:
+            pass
+
+    def _write_snapshot(self, dataset):
+        if self.snapshot_dir is None:
+            return
+        try:
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            parquet_path, pickle_path, _ = self._paths()
+            try:
+                dataset.df.to_parquet(parquet_path.with_suffix('.parquet.tmp'), index=False)
+                os.replace(parquet_path.with_suffix('.parquet.tmp'), parquet_path)
+                stale = pickle_path
+            except ImportError:
+                dataset.df.to_pickle(pickle_path.with_suffix('.pkl.tmp'))
+                os.replace(pickle_path.with_suffix('.pkl.tmp'), pickle_path)
+                stale = parquet_path
+            if stale.exists():
+                stale.unlink()
+        except OSError:
+            # A missing snapshot only costs a cold start
+            return
+        self._write_metadata(dataset)
+
+    def _load_snapshot(self):
+        if self.snapshot_dir is None:
+            return None
+        parquet_path, pickle_path, meta_path = self._paths()
+        try:
+            meta = json.loads(meta_path.read_text())
+            if meta.get('parser') != self._parser() or meta.get('source') != self.source_id:
+                return None
+            if parquet_path.exists():
+                df = pd.read_parquet(parquet_path)
+            elif pickle_path.exists():
+                df = pd.read_pickle(pickle_path)
+            else:
+                return None
+        except (OSError, ValueError, ImportError):
+            return None
+        return Dataset(df, meta['version'], meta['fetched_at'], meta.get('etag'), meta.get('last_modified'))
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_dataset_cache(name, source, **kwargs):
+    """
+    Returns the process-wide DatasetCache registered under name. Raises
+    ValueError when name is already registered with a different source.
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                cache = _caches[name] = DatasetCache(name, source, **kwargs)
+    if cache.source.identity != source.identity:
+        raise ValueError(f"Dataset cache {name!r} is already registered with a different source")
+    return cache
+
+
+def source_for(location):
+    """Returns a FileSource for local paths and an HttpSource for URLs"""
+    if str(location).startswith(('http://', 'https://')):
+        return HttpSource(location)
+    return FileSource(location)
@@ -0,0 +1,264 @@
+"""
+Typed feature schemas shared by training and inference
+
+Each model artifact (model/<name>.sav) has a <name>.schema.json sidecar that
+lists its input features in column order with optional valid ranges. A
+validator compiled from the schema turns form values, JSON rows or CSV
+frames into a contiguous float64 array in that order, and rejects anything
+that does not fit before it reaches scikit-learn.
+"""
+import json
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+SCHEMA_VERSION = 1
+
+
+class SchemaError(ValueError):
+    """Input does not match a model's feature schema"""
+
+
+class Feature:
+    __slots__ = ("name", "label", "min", "max")
+
+    def __init__(self, name, label=None, min=None, max=None):
+        self.name = name
+        self.label = label or name
+        self.min = min
+        self.max = max
+
+    def to_dict(self):
+        return {'name': self.name, 'label': self.label, 'min': self.min, 'max': self.max}
+
+
+class FeatureSchema:
+    def __init__(self, model, features):
+        self.model = model
+        self.features = tuple(features)
+
+    @property
+    def names(self):
+        return [feature.name for feature in self.features]
+
+    def to_dict(self):
+        return {
+            'schema_version': SCHEMA_VERSION,
+            'model': self.model,
+            'dtype': 'float64',
+            'features': [feature.to_dict() for feature in self.features],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('schema_version') != SCHEMA_VERSION:
+            raise SchemaError(f"Unsupported schema version {data.get('schema_version')}")
+        return cls(data['model'], [Feature(**feature) for feature in data['features']])
+
+
+# Inputs of the Pregnancy Risk Prediction form, in training column order.
+# Ranges only catch typos and unit mix-ups; they are not clinical limits.
+MATERNAL_INPUTS = (
+    Feature('Age', 'Age', 0, 100),
+    Feature('DiastolicBP', 'Diastolic BP', 20, 200),
+    # No lower bound: data/maternal_health.csv has values below zero
+    Feature('BS', 'Blood glucose', None, 50),
+    Feature('BodyTemp', 'Body temperature', 80, 115),
+    Feature('HeartRate', 'Heart rate', 20, 250),
+)
+
+# Cardiotocogram measurements collected on the Fetal Health Prediction form,
+# named as in data/fetal_health.csv. Models use a prefix of this list.
+CTG_INPUTS = (
+    Feature('baseline_value', 'Baseline Value', 50, 250),
+    Feature('accelerations', 'Accelerations'),
+    Feature('fetal_movement', 'Fetal Movement'),
+    Feature('uterine_contractions', 'Uterine Contractions'),
+    Feature('light_decelerations', 'Light Decelerations'),
+    Feature('severe_decelerations', 'Severe Decelerations'),
+    Feature('prolongued_decelerations', 'Prolongued Decelerations'),
+    Feature('abnormal_short_term_variability', 'Abnormal Short Term Variability'),
+    Feature('mean_value_of_short_term_variability', 'Mean Value Of Short Term Variability'),
+    Feature('percentage_of_time_with_abnormal_long_term_variability', 'Percentage Of Time With ALTV'),
+    Feature('mean_value_of_long_term_variability', 'Mean Value Long Term Variability'),
+    Feature('histogram_width', 'Histogram Width'),
+    Feature('histogram_min', 'Histogram Min'),
+    Feature('histogram_max', 'Histogram Max'),
+    Feature('histogram_number_of_peaks', 'Histogram Number Of Peaks'),
+    Feature('histogram_number_of_zeroes', 'Histogram Number Of Zeroes'),
+    Feature('histogram_mode', 'Histogram Mode'),
+    Feature('histogram_mean', 'Histogram Mean'),
+    Feature('histogram_median', 'Histogram Median'),
+    Feature('histogram_variance', 'Histogram Variance'),
+    Feature('histogram_tendency', 'Histogram Tendency'),
+)
+
+
+def schema_for(model, names):
+    """Builds a schema from known input names, keeping their labels and ranges"""
+    known = {feature.name: feature for feature in MATERNAL_INPUTS + CTG_INPUTS}
+    return FeatureSchema(model, [known.get(name) or Feature(name) for name in names])
+
+
+def schema_path(model_path):
+    """Returns the schema sidecar path for a model artifact"""
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.schema.json")
+
+
+def save_schema(model_path, schema):
+    path = schema_path(model_path)
+    path.write_text(json.dumps(schema.to_dict(), indent=2))
+    return path
+
+
+def load_schema(model_path, model=None):
+    """
+    Loads the schema saved next to model_path. Without a sidecar the schema
+    is derived from the fitted model's feature count (positional input only).
+    """
+    path = schema_path(model_path)
+    if path.exists():
+        schema = FeatureSchema.from_dict(json.loads(path.read_text()))
+        if model is not None and len(schema.features) != model.n_features_in_:
+            raise SchemaError(f"{path} lists {len(schema.features)} features "
+                              f"but the model expects {model.n_features_in_}")
+        return schema
+    if model is None:
+        raise FileNotFoundError(path)
+    names = getattr(model, 'feature_names_in_', None)
+    if names is None:
+        names = [f"feature_{i}" for i in range(model.n_features_in_)]
+    return FeatureSchema(Path(model_path).stem, [Feature(str(name)) for name in names])
+
+
+def feature_bounds(schema):
+    """Returns (lower, upper) float64 arrays, with -inf/inf where a feature has no bound"""
+    lower = np.array([-np.inf if f.min is None else f.min for f in schema.features], dtype=np.float64)
+    upper = np.array([np.inf if f.max is None else f.max for f in schema.features], dtype=np.float64)
+    return lower, upper
+
+
+def select_columns(frame, schema):
+    """
+    Returns frame's feature columns in schema order, matching names
+    case-insensitively and ignoring extra columns. Raises SchemaError when a
+    feature column is missing.
+    """
+    lookup = {str(column).strip().lower(): column for column in frame.columns}
+    missing = [name for name in schema.names if name.lower() not in lookup]
+    if missing:
+        raise SchemaError(f"Missing required columns: {', '.join(missing)}")
+    return frame[[lookup[name.lower()] for name in schema.names]]
+
+
+def _range_text(low, high):
+    if np.isfinite(low) and np.isfinite(high):
+        return f"between {low:g} and {high:g}"
+    return f"at least {low:g}" if np.isfinite(low) else f"at most {high:g}"
+
+
+def check_rows(schema, X):
+    """
+    Checks each row of a (n, n_features) float64 array against the schema.
+
+    Returns (valid, errors): a boolean mask of rows whose features are all
+    finite and within range, and per row the message the form would show
+    for its first bad feature ('' for valid rows).
+    """
+    labels = [feature.label for feature in schema.features]
+    lower, upper = feature_bounds(schema)
+    finite = np.isfinite(X)
+    with np.errstate(invalid='ignore'):
+        bad = ~finite | (X < lower) | (X > upper)
+    valid = ~bad.any(axis=1)
+    errors = np.full(len(X), '', dtype=object)
+    for row in np.flatnonzero(~valid):
+        col = int(np.argmax(bad[row]))
+        if not finite[row, col]:
+            errors[row] = f"{labels[col]} is missing or not a number"
+        else:
+            errors[row] = (f"{labels[col]} must be {_range_text(lower[col], upper[col])} "
+                           f"(got {X[row, col]:g})")
+    return valid, errors
+
+
+def compile_validator(schema):
+    """
+    Returns validate(data) -> contiguous float64 array of shape (n, n_features).
+
+    data may be a mapping of feature name to value (one row), a sequence of
+    such mappings, a DataFrame with the feature columns (any order, extra
+    columns ignored, names matched case-insensitively) or a 2-D sequence or
+    array already in schema order. Raises SchemaError on any mismatch.
+    """
+    names = schema.names
+    labels = [feature.label for feature in schema.features]
+    n_features = len(names)
+
+    def row_from_mapping(row):
+        values = []
+        for name, label in zip(names, labels):
+            value = row.get(name)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                raise SchemaError(f"{label} is required")
+            try:
+                values.append(float(value))
+            except (TypeError, ValueError):
+                raise SchemaError(f"{label} must be a number, got {value!r}")
+        return values
+
+    def validate(data):
+        if isinstance(data, Mapping):
+            X = np.array([row_from_mapping(data)], dtype=np.float64)
+        elif hasattr(data, 'columns'):
+            frame = select_columns(data, schema)
+            try:
+                X = frame.to_numpy(dtype=np.float64)
+            except (TypeError, ValueError):
+                raise SchemaError("Feature columns must be numeric")
+        elif not hasattr(data, '__len__'):
+            raise SchemaError(f"Expected a row, a list of rows or a table, got {type(data).__name__}")
+        elif len(data) and isinstance(data[0], Mapping):
+            X = np.array([row_from_mapping(row) for row in data], dtype=np.float64)
+        else:
+            try:
+                X = np.array(data, dtype=np.float64)
+            except (TypeError, ValueError):
+                raise SchemaError("Feature values must be numeric")
+            if X.ndim == 1:
+                X = X.reshape(1, -1)
+
+        if X.ndim != 2 or X.shape[1] != n_features:
+            raise SchemaError(f"Expected {n_features} features ({', '.join(names)}), "
+                              f"got {X.shape[-1] if X.ndim else 0}")
+        valid, errors = check_rows(schema, X)
+        if not valid.all():
+            row = int(np.argmin(valid))
+            raise SchemaError(errors[row] if len(X) == 1 else f"{errors[row]} (row {row})")
+        return np.ascontiguousarray(X)
+
+    validate.schema = schema
+    return validate
+
+
+_lock = threading.Lock()
+_validators = {}
+
+
+def get_validator(model_path, model=None):
+    """Returns the compiled validator for a model, recompiled when its schema file changes"""
+    path = schema_path(model_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    key = str(Path(model_path).resolve())
+    cached = _validators.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with _lock:
+            cached = _validators[key] = (mtime_ns, compile_validator(load_schema(model_path, model)))
+    return cached[1]
@@ -0,0 +1,55 @@
+"""
+Cache of serialized Plotly figures per dataset version
+"""
+import json
+import threading
+
+import plotly.io as pio
+
+_lock = threading.Lock()
+
+
+class CachedFigure:
+    """
+    The serialized figure JSON plus a Figure rebuilt from it once.
+
+    st.plotly_chart re-validates plain dicts on every call but trusts Figure
+    objects, so serving the prebuilt Figure keeps warm renders cheap. The
+    Figure is shared by every session and must not be modified.
+    """
+
+    __slots__ = ("json", "figure")
+
+    def __init__(self, figure_json):
+        self.json = figure_json
+        self.figure = pio.from_json(figure_json)
+
+
+def figure_key(chart, params):
+    """Returns a hashable key for a chart name and its parameters"""
+    return (chart, json.dumps(params, sort_keys=True, default=str))
+
+
+def get_cached_figure(dataset, chart, build, **params):
+    """
+    Returns the CachedFigure for chart, calling build(**params) to create
+    the Plotly figure only the first time for this dataset version and params
+    """
+    figures = dataset.derived.setdefault('figures', {})
+    key = figure_key(chart, params)
+    cached = figures.get(key)
+    if cached is None:
+        cached = CachedFigure(build(**params).to_json())
+        with _lock:
+            cached = figures.setdefault(key, cached)
+    return cached
+
+
+def get_figure_json(dataset, chart, build, **params):
+    """Returns the cached figure serialized as JSON"""
+    return get_cached_figure(dataset, chart, build, **params).json
+
+
+def get_figure(dataset, chart, build, **params):
+    """Returns the cached, read-only figure ready for st.plotly_chart"""
+    return get_cached_figure(dataset, chart, build, **params).figure
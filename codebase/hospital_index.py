@@ -0,0 +1,196 @@
+"""
+Offline nearest-hospital search
+
+Hospitals are read from a local CSV (data/hospitals.csv by default, or the
+file named by HEY_MUMMA_HOSPITALS) with at least these columns:
+
+    name,latitude,longitude
+
+and optionally address, district, state, phone and type. Coordinates are
+WGS84 decimal degrees. The facilities are indexed as points on the unit
+sphere in a KD-tree: the straight-line (chord) distance between two such
+points grows monotonically with their great-circle distance, so nearest
+and radius queries are exact haversine queries, and take microseconds
+even with hundreds of thousands of rows, without network access.
+"""
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+DEFAULT_PATH = Path(__file__).parent.parent / "data" / "hospitals.csv"
+REQUIRED_COLUMNS = ['name', 'latitude', 'longitude']
+OPTIONAL_COLUMNS = ['address', 'district', 'state', 'phone', 'type']
+EARTH_RADIUS_KM = 6371.0088
+LEAF_SIZE = 16
+
+# Grid cells per 256 px map tile when clustering markers (about 64 px cells)
+CELLS_PER_TILE = 4
+MIN_ZOOM, MAX_ZOOM = 1, 18
+
+_lock = threading.Lock()
+_indexes = {}
+
+
+def hospitals_path():
+    return Path(os.environ.get("HEY_MUMMA_HOSPITALS", DEFAULT_PATH))
+
+
+def load_hospitals(path):
+    """
+    Reads the hospital CSV, keeping the known columns, and drops rows
+    without a name or with coordinates outside the valid range.
+    Raises ValueError when a required column is missing.
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"{path} is missing required columns: {', '.join(missing)}")
+
+    columns = REQUIRED_COLUMNS + [column for column in OPTIONAL_COLUMNS if column in header]
+    df = pd.read_csv(path, usecols=columns,
+                     dtype={column: 'string' for column in columns if column not in ('latitude', 'longitude')})
+    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
+    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+    valid = (df['name'].notna() & df['latitude'].between(-90, 90) & df['longitude'].between(-180, 180))
+    return df[valid].reset_index(drop=True)
+
+
+def to_unit_vectors(latitudes, longitudes):
+    """Converts degrees to (n, 3) points on the unit sphere"""
+    lat = np.radians(np.atleast_1d(np.asarray(latitudes, dtype=np.float64)))
+    lon = np.radians(np.atleast_1d(np.asarray(longitudes, dtype=np.float64)))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def chord_to_km(chord):
+    return 2 * np.arcsin(np.clip(chord / 2, 0, 1)) * EARTH_RADIUS_KM
+
+
+def km_to_chord(km):
+    return 2 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+class HospitalIndex:
+    """KD-tree over hospital coordinates answering great-circle distance queries in km"""
+
+    def __init__(self, hospitals):
+        self.hospitals = hospitals
+        self.coordinates = np.ascontiguousarray(hospitals[['latitude', 'longitude']].to_numpy(dtype=np.float64))
+        self.points = to_unit_vectors(self.coordinates[:, 0], self.coordinates[:, 1])
+        self.tree = cKDTree(self.points, leafsize=LEAF_SIZE)
+        self.version = hashlib.sha256(
+            pd.util.hash_pandas_object(hospitals, index=False).to_numpy().tobytes()).hexdigest()[:16]
+        self._clusters = {}
+        self._clusters_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.hospitals)
+
+    def nearest_batch(self, latitudes, longitudes, k=5):
+        """
+        Returns (distances_km, indices), each of shape (n_points, k), for
+        many query points at once, nearest first
+        """
+        queries = to_unit_vectors(latitudes, longitudes)
+        k = min(k, len(self))
+        if k == 0:
+            return np.empty((len(queries), 0)), np.empty((len(queries), 0), dtype=np.intp)
+        chords, indices = self.tree.query(queries, k=k)
+        return chord_to_km(chords).reshape(-1, k), indices.reshape(-1, k)
+
+    def within_batch(self, latitudes, longitudes, radius_km):
+        """
+        Returns per query point (distances_km, indices) of every hospital
+        within radius_km, nearest first
+        """
+        queries = to_unit_vectors(latitudes, longitudes)
+        results = []
+        for query, indices in zip(queries, self.tree.query_ball_point(queries, km_to_chord(radius_km))):
+            indices = np.asarray(indices, dtype=np.intp)
+            chords = np.linalg.norm(self.points[indices] - query, axis=1)
+            order = np.argsort(chords, kind='stable')
+            results.append((chord_to_km(chords[order]), indices[order]))
+        return results
+
+    def clusters(self, zoom):
+        """
+        Grid clusters of every hospital at zoom (see grid_clusters),
+        aggregated once per zoom level for the overview map's zoom layers
+        """
+        zoom = int(np.clip(zoom, MIN_ZOOM, MAX_ZOOM))
+        clusters = self._clusters.get(zoom)
+        if clusters is None:
+            with self._clusters_lock:
+                clusters = self._clusters.get(zoom)
+                if clusters is None:
+                    clusters = self._clusters[zoom] = grid_clusters(
+                        self.coordinates[:, 0], self.coordinates[:, 1], zoom)
+        return clusters
+
+    def _results(self, distances_km, indices):
+        result = self.hospitals.iloc[indices].copy()
+        result['distance_km'] = distances_km
+        return result.reset_index(drop=True)
+
+    def nearest(self, latitude, longitude, k=5):
+        """Returns the k nearest hospitals with a distance_km column"""
+        distances, indices = self.nearest_batch(latitude, longitude, k)
+        return self._results(distances[0], indices[0])
+
+    def within(self, latitude, longitude, radius_km, limit=None):
+        """Returns the hospitals within radius_km, nearest first"""
+        distances, indices = self.within_batch(latitude, longitude, radius_km)[0]
+        return self._results(distances[:limit], indices[:limit])
+
+
+def get_hospital_index(path=None):
+    """
+    Returns the process-wide index for the hospital CSV at path, rebuilt
+    when the file changes, or None when there is no such file
+    """
+    path = Path(path) if path else hospitals_path()
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    key = str(path.resolve())
+    cached = _indexes.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with _lock:
+            cached = _indexes.get(key)
+            if cached is None or cached[0] != mtime_ns:
+                cached = _indexes[key] = (mtime_ns, HospitalIndex(load_hospitals(path)))
+    return cached[1]
+
+
+def cell_size(zoom):
+    """Grid cell edge in degrees for clustering at a web map zoom level"""
+    return 360.0 / (2 ** zoom) / CELLS_PER_TILE
+
+
+def grid_clusters(latitudes, longitudes, zoom):
+    """
+    Groups points into square grid cells sized for zoom.
+
+    Returns (cluster_lat, cluster_lon, counts, labels) where the cluster
+    position is the mean of its members and labels maps each input point to
+    its cluster.
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    size = cell_size(zoom)
+    # One integer per cell (row-major), so np.unique works on a flat array
+    rows = np.floor((latitudes + 90.0) / size).astype(np.int64)
+    columns = np.floor((longitudes + 180.0) / size).astype(np.int64)
+    cells = rows * (int(360.0 / size) + 2) + columns
+    _, labels, counts = np.unique(cells, return_inverse=True, return_counts=True)
+    labels = labels.ravel()
+    cluster_lat = np.bincount(labels, weights=latitudes) / counts
+    cluster_lon = np.bincount(labels, weights=longitudes) / counts
+    return cluster_lat, cluster_lon, counts, labels
@@ -0,0 +1,172 @@
+"""
+Folium maps for the Nearest Hospitals page
+
+Small result sets get one marker per hospital. Larger ones are clustered on
+the server into grid cells (codebase.hospital_index.grid_clusters), so the
+browser receives a few hundred markers instead of every facility. The
+overview of every hospital has one clustered layer per zoom band, and a
+small script shows the layer for the current zoom, so the clusters split
+as the user zooms in.
+"""
+import html
+
+import folium
+import numpy as np
+from branca.element import MacroElement
+from jinja2 import Template
+
+from codebase.hospital_index import MAX_ZOOM, MIN_ZOOM, grid_clusters
+
+INDIA_CENTER = (20.5937, 78.9629)
+DEFAULT_ZOOM = 4
+MAX_INDIVIDUAL_MARKERS = 200
+# Markers across all zoom layers of one map; deeper zooms reuse the last layer
+MAX_LAYERED_MARKERS = 1000
+
+
+def fit_zoom(points):
+    """Web map zoom level at which points (n, 2 lat/lon) roughly fill the view"""
+    extent = float(np.ptp(points, axis=0).max()) if len(points) > 1 else 0.0
+    return int(np.clip(np.floor(np.log2(360.0 / max(extent, 1e-3))), 1, MAX_ZOOM))
+
+
+def _popup(row):
+    lines = [f"<b>{html.escape(str(row['name']))}</b>"]
+    if 'distance_km' in row:
+        lines.append(f"{row['distance_km']:.1f} km away")
+    for column in ('address', 'phone', 'type'):
+        value = row.get(column)
+        if isinstance(value, str) and value:
+            lines.append(html.escape(value))
+    return folium.Popup("<br>".join(lines), max_width=300)
+
+
+def _cluster_icon(count):
+    size = 24 + min(int(count).bit_length() * 4, 32)
+    return folium.DivIcon(
+        icon_size=(size, size), icon_anchor=(size // 2, size // 2),
+        html=(f'<div style="width:{size}px;height:{size}px;line-height:{size}px;border-radius:50%;'
+              f'background:rgba(255,105,180,0.8);color:#fff;text-align:center;font-weight:bold;">'
+              f'{count}</div>'))
+
+
+def add_hospital_markers(fmap, hospitals, zoom, max_markers=MAX_INDIVIDUAL_MARKERS, clusters=None):
+    """
+    Adds individual markers, or grid clusters when there are more than
+    max_markers. clusters may be precomputed grid_clusters output for
+    hospitals at zoom.
+    """
+    if len(hospitals) <= max_markers:
+        for _, row in hospitals.iterrows():
+            folium.Marker((row['latitude'], row['longitude']), popup=_popup(row),
+                          tooltip=html.escape(str(row['name'])),
+                          icon=folium.Icon(color='blue', icon='plus-sign')).add_to(fmap)
+        return fmap
+
+    if clusters is None:
+        clusters = grid_clusters(hospitals['latitude'], hospitals['longitude'], zoom)
+    cluster_lat, cluster_lon, counts, labels = clusters
+    singles = np.flatnonzero(counts == 1)
+    for cluster in np.flatnonzero(counts > 1):
+        folium.Marker((cluster_lat[cluster], cluster_lon[cluster]), icon=_cluster_icon(counts[cluster]),
+                      tooltip=f"{counts[cluster]} hospitals").add_to(fmap)
+    single_rows = np.flatnonzero(np.isin(labels, singles))
+    for _, row in hospitals.iloc[single_rows].iterrows():
+        folium.Marker((row['latitude'], row['longitude']), popup=_popup(row),
+                      tooltip=html.escape(str(row['name']))).add_to(fmap)
+    return fmap
+
+
+class ZoomLayers(MacroElement):
+    """Shows each layer only between its min and max zoom"""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function() {
+            var map = {{ this._parent.get_name() }};
+            var bands = [{% for layer, low, high in this.bands %}
+                [{{ layer.get_name() }}, {{ low }}, {{ high }}],{% endfor %}
+            ];
+            function showBand() {
+                var zoom = map.getZoom();
+                bands.forEach(function(band) {
+                    var visible = zoom >= band[1] && zoom <= band[2];
+                    if (visible && !map.hasLayer(band[0])) { map.addLayer(band[0]); }
+                    if (!visible && map.hasLayer(band[0])) { map.removeLayer(band[0]); }
+                });
+            }
+            map.on('zoomend', showBand);
+            showBand();
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, bands):
+        super().__init__()
+        self._name = 'ZoomLayers'
+        self.bands = bands
+
+
+def add_zoom_layers(fmap, hospitals, clusters_for, budget=MAX_LAYERED_MARKERS):
+    """
+    Adds one clustered layer per distinct zoom band, where clusters_for(zoom)
+    returns grid_clusters output for hospitals. Grids of consecutive zooms
+    nest, so an unchanged cluster count means an unchanged layer. Once the
+    marker budget is spent, or every hospital has its own marker, the last
+    layer is kept for all deeper zooms.
+    """
+    bands = []
+    used = 0
+    for zoom in range(MIN_ZOOM, MAX_ZOOM + 1):
+        clusters = clusters_for(zoom)
+        n_markers = len(clusters[2])
+        if bands and n_markers == bands[-1][3]:
+            bands[-1][2] = zoom
+            continue
+        if bands and used + n_markers > budget:
+            break
+        bands.append([clusters, zoom, zoom, n_markers])
+        used += n_markers
+        if n_markers == len(hospitals):
+            break
+    bands[-1][2] = MAX_ZOOM
+
+    layers = []
+    for clusters, low, high, _ in bands:
+        layer = folium.FeatureGroup(name=f"Hospitals (zoom {low}-{high})", control=False)
+        add_hospital_markers(layer, hospitals, low, max_markers=0, clusters=clusters)
+        layer.add_to(fmap)
+        layers.append((layer, low, high))
+    fmap.add_child(ZoomLayers(layers))
+    return fmap
+
+
+def build_hospital_map(hospitals=None, origin=None, center=INDIA_CENTER, zoom=DEFAULT_ZOOM):
+    """
+    Returns a folium.Map with the hospitals (if any) and the search origin,
+    zoomed to fit the results. Large result sets are clustered for that zoom
+    only, which keeps each new search quick to render.
+    """
+    points = None
+    if hospitals is not None and len(hospitals):
+        points = hospitals[['latitude', 'longitude']].to_numpy(dtype=np.float64)
+        if origin is not None:
+            points = np.vstack([points, [origin]])
+        zoom = fit_zoom(points)
+
+    fmap = folium.Map(location=list(origin or center), zoom_start=zoom)
+    if origin is not None:
+        folium.Marker(list(origin), tooltip="Search location",
+                      icon=folium.Icon(color='red', icon='user')).add_to(fmap)
+    if points is not None:
+        add_hospital_markers(fmap, hospitals, zoom)
+        fmap.fit_bounds([points.min(axis=0).tolist(), points.max(axis=0).tolist()])
+    return fmap
+
+
+def build_overview_map(index, center=INDIA_CENTER, zoom=DEFAULT_ZOOM):
+    """Returns a map of every hospital in index, layered by the index's per-zoom clusters"""
+    fmap = folium.Map(location=list(center), zoom_start=zoom)
+    if len(index):
+        add_zoom_layers(fmap, index.hospitals, index.clusters)
+    return fmap
@@ -0,0 +1,149 @@
+"""
+Index of the fetal development images and their resized WebP variants
+
+The index is built once per process by scanning the image folders, so
+lookups never touch the filesystem. Variants are produced offline with:
+
+    python -m codebase.image_assets
+"""
+import os
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+SOURCE_DIRS = [
+    # In order of preference
+    (ROOT / "graphics" / "fetal_development", re.compile(r"^week_(\d+)\.(jpg|png)$")),
+    (ROOT / "images", re.compile(r"^week-(\d+)\.(jpg|png)$")),
+]
+VARIANT_DIR = ROOT / "graphics" / "fetal_development" / "webp"
+VARIANT_PATTERN = re.compile(r"^week_(\d+)_(\d+)w\.webp$")
+
+# Widths the Fetal Development page displays at (1x and 2x for the image column)
+DISPLAY_WIDTHS = (320, 640)
+DEFAULT_WIDTH = 640
+WEBP_QUALITY = 80
+EXTENSION_PREFERENCE = {"jpg": 0, "png": 1}
+
+_lock = threading.Lock()
+_index = None
+
+
+class WeekImage:
+    """The best source image for a week and its resized variants by width"""
+
+    __slots__ = ("week", "source", "variants")
+
+    def __init__(self, week, source, variants):
+        self.week = week
+        self.source = source
+        self.variants = variants
+
+    def best_for(self, width):
+        """Returns the smallest variant at least width wide, else the source"""
+        for variant_width in sorted(self.variants):
+            if variant_width >= width:
+                return self.variants[variant_width]
+        return self.source
+
+
+def _scan(directory, pattern):
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match and entry.is_file() and entry.stat().st_size > 0:
+                    yield match, entry.path
+    except FileNotFoundError:
+        return
+
+
+def build_index():
+    """Scans the image folders and returns {week: WeekImage}"""
+    sources = {}
+    for rank, (directory, pattern) in enumerate(SOURCE_DIRS):
+        for match, path in _scan(directory, pattern):
+            week = int(match.group(1))
+            preference = (rank, EXTENSION_PREFERENCE[match.group(2)])
+            if week not in sources or preference < sources[week][0]:
+                sources[week] = (preference, path)
+
+    variants = {}
+    for match, path in _scan(VARIANT_DIR, VARIANT_PATTERN):
+        variants.setdefault(int(match.group(1)), {})[int(match.group(2))] = path
+
+    return {week: WeekImage(week, path, variants.get(week, {}))
+            for week, (_, path) in sources.items()}
+
+
+def get_index():
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = build_index()
+    return _index
+
+
+def reload_index():
+    """Rebuilds the index, e.g. after new variants were generated"""
+    global _index
+    with _lock:
+        _index = build_index()
+    read_image_bytes.cache_clear()
+
+
+def get_week_image_path(week, width=None):
+    """Returns the best file for week (a variant when width is given) or None"""
+    image = get_index().get(week)
+    if image is None:
+        return None
+    return image.best_for(width) if width else image.source
+
+
+@lru_cache(maxsize=96)
+def read_image_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def get_week_image_bytes(week, width=DEFAULT_WIDTH):
+    """Returns the cached bytes of the best image for week, or None"""
+    path = get_week_image_path(week, width)
+    if path is None:
+        return None
+    try:
+        return read_image_bytes(path)
+    except OSError:
+        return None
+
+
+def build_variants(widths=DISPLAY_WIDTHS, quality=WEBP_QUALITY):
+    """
+    Writes resized, recompressed WebP copies of every week's source image
+    into VARIANT_DIR. Requires Pillow. Returns the number of files written.
+    """
+    from PIL import Image
+
+    VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for week, image in sorted(build_index().items()):
+        with Image.open(image.source) as original:
+            original = original.convert("RGB")
+            for width in widths:
+                resized = original
+                if original.width > width:
+                    height = round(original.height * width / original.width)
+                    resized = original.resize((width, height), Image.LANCZOS)
+                resized.save(VARIANT_DIR / f"week_{week}_{width}w.webp", "WEBP",
+                             quality=quality, method=6)
+                written += 1
+    reload_index()
+    return written
+
+
+if __name__ == "__main__":
+    count = build_variants()
+    print(f"Wrote {count} WebP variants to {VARIANT_DIR}")
@@ -0,0 +1,268 @@
+"""
+Standalone HTTP inference service for the maternal and fetal models
+
+Run with:
+    python -m codebase.inference_server --host 127.0.0.1 --port 8600
+
+Endpoints:
+    GET  /health                     -> {"status": "ok", "models": [...]}
+    GET  /metrics                    -> span latency histograms in Prometheus
+                                        text format (HEY_MUMMA_TRACING=1)
+    GET  /static/theme.<hash>.css    -> the app's minified theme (text/css,
+                                        cached for a year; see codebase.theme)
+    POST /predict/<model>            -> single row {"features": [...]}
+                                        or batch {"rows": [[...], ...]}
+                                        or a text/csv body with a header row
+                                        naming the schema's features
+"""
+import argparse
+import asyncio
+import io
+import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from codebase.feature_schema import SchemaError, get_validator
+from codebase.model_registry import get_model
+from codebase.theme import get_theme
+from codebase.tracing import export_prometheus, span
+
+# Inputs are checked against each model's <name>.schema.json sidecar
+MODELS = {
+    'maternal': "model/finalized_maternal_model.sav",
+    'fetal': "model/fetal_health_classifier.sav",
+}
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Static files are content-hashed, so they never change under their URL
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    """An error reported back to the client with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class StaticFile:
+    """A non-JSON response body with its own status, content type and headers"""
+
+    __slots__ = ("status", "data", "content_type", "headers")
+
+    def __init__(self, data, content_type, headers=None, status=200):
+        self.status = status
+        self.data = data
+        self.content_type = content_type
+        self.headers = headers or {}
+
+
+def _score(model, X):
+    """Runs predict and predict_proba on a float64 feature matrix"""
+    predictions = model.predict(X)
+    probabilities = model.predict_proba(X)
+    return {
+        'classes': np.asarray(model.classes_).tolist(),
+        'predictions': np.asarray(predictions).tolist(),
+        'probabilities': np.asarray(probabilities).round(6).tolist(),
+    }
+
+
+def _parse_json_rows(body, validate):
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise RequestError(400, "Body is not valid JSON")
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Expected a JSON object")
+
+    if 'features' in payload:
+        rows, single = [payload['features']], True
+    elif 'rows' in payload:
+        rows, single = payload['rows'], False
+    else:
+        raise RequestError(400, "Expected a 'features' or 'rows' field")
+
+    try:
+        return validate(rows), single
+    except SchemaError as e:
+        raise RequestError(400, str(e))
+
+
+def _parse_csv_rows(body, validate):
+    try:
+        df = pd.read_csv(io.BytesIO(body))
+    except Exception as e:
+        raise RequestError(400, f"Could not parse CSV: {e}")
+    try:
+        return validate(df), False
+    except SchemaError as e:
+        raise RequestError(400, str(e))
+
+
+def _predict(model, validate, parse, body):
+    """
+    Parses, validates and scores a request body. Runs on the thread pool as
+    one job so large CSV or JSON bodies never block the event loop.
+    """
+    X, single = parse(body, validate)
+    return _score(model, X), single
+
+
+class InferenceServer:
+    """asyncio HTTP front end that scores requests on a thread pool"""
+
+    def __init__(self, host='127.0.0.1', port=8600, workers=4):
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.models = {name: get_model(path) for name, path in MODELS.items()}
+        self.validators = {name: get_validator(path, self.models[name]) for name, path in MODELS.items()}
+
+    async def handle_predict(self, name, headers, body):
+        if name not in self.models:
+            raise RequestError(404, f"Unknown model '{name}'")
+        parse = _parse_csv_rows if 'csv' in headers.get('content-type', '') else _parse_json_rows
+
+        loop = asyncio.get_running_loop()
+        with span(f"inference.{name}"):
+            result, single = await loop.run_in_executor(
+                self.executor, _predict, self.models[name], self.validators[name], parse, body)
+        if single:
+            return {
+                'classes': result['classes'],
+                'prediction': result['predictions'][0],
+                'probabilities': result['probabilities'][0],
+            }
+        return result
+
+    def handle_static(self, path, headers):
+        theme = get_theme()
+        if path != theme.path:
+            raise RequestError(404, f"No static file {path}")
+        etag = f'"{theme.digest}"'
+        cache_headers = {'Cache-Control': STATIC_CACHE_CONTROL, 'ETag': etag}
+        if headers.get('if-none-match') == etag:
+            return StaticFile(b'', "text/css; charset=utf-8", cache_headers, status=304)
+        return StaticFile(theme.data, "text/css; charset=utf-8", cache_headers)
+
+    async def dispatch(self, method, path, headers, body):
+        if path == '/health':
+            if method != 'GET':
+                raise RequestError(405, "Use GET")
+            return {'status': 'ok', 'models': sorted(self.models)}
+        if path == '/metrics':
+            if method != 'GET':
+                raise RequestError(405, "Use GET")
+            return export_prometheus()
+        if path.startswith('/static/'):
+            if method != 'GET':
+                raise RequestError(405, "Use GET")
+            return self.handle_static(path, headers)
+        if path.startswith('/predict/'):
+            if method != 'POST':
+                raise RequestError(405, "Use POST")
+            return await self.handle_predict(path[len('/predict/'):], headers, body)
+        raise RequestError(404, f"No route for {path}")
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                started = time.perf_counter()
+                try:
+                    length = int(headers.get('content-length', 0))
+                    if length > MAX_BODY_SIZE:
+                        raise RequestError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b''
+                    payload = await self.dispatch(method, target.split('?', 1)[0], headers, body)
+                    status = 200
+                except RequestError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'error': str(e)}
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                extra_headers = {}
+                if isinstance(payload, StaticFile):
+                    status, data, content_type = payload.status, payload.data, payload.content_type
+                    extra_headers = payload.headers
+                elif isinstance(payload, str):
+                    data, content_type = payload.encode('utf-8'), "text/plain; version=0.0.4"
+                else:
+                    data, content_type = json.dumps(payload).encode('utf-8'), "application/json"
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                head = (
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    + "".join(f"{key}: {value}\r\n" for key, value in extra_headers.items())
+                    + f"X-Inference-Time-Ms: {elapsed_ms:.3f}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                writer.write(head.encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        print(f"Inference service listening on http://{self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+
+
+def predict_remote(base_url, model_name, rows, timeout=10):
+    """
+    Client helper used by the Streamlit pages.
+
+    Posts a batch of feature rows to the inference service and returns the
+    decoded JSON response.
+    """
+    request = urllib.request.Request(
+        f"{base_url.rstrip('/')}/predict/{model_name}",
+        data=json.dumps({'rows': rows}).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hey Mumma inference service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--workers', type=int, default=4, help="Scoring thread pool size")
+    args = parser.parse_args()
+
+    asyncio.run(InferenceServer(args.host, args.port, args.workers).serve())
@@ -0,0 +1,105 @@
+"""
+Thread-safe in-process LRU cache
+
+Shared by the prediction cache and the rendered map cache: a bounded
+OrderedDict (least recently used entries are evicted first) with optional
+per-entry expiry, hit/miss counters and build-once semantics for concurrent
+misses on the same key.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe LRU cache with optional per-entry expiry and hit/miss counters"""
+
+    def __init__(self, max_size, ttl=None, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._building = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key):
+        # Caller holds self._lock
+        item = self._entries.get(key)
+        if item is None:
+            return _MISSING
+        if item[0] is not None and item[0] <= self.clock():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return item[1]
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_build(self, key, build):
+        """
+        Returns the value stored under key, calling build() and storing its
+        result on a miss. Concurrent misses for the same key build once.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._building.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+            try:
+                value = build()
+                # Store before dropping the build lock, so a miss arriving
+                # in between finds the entry instead of building again
+                self.put(key, value)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+        return value
+
+    def values(self):
+        with self._lock:
+            return [item[1] for item in self._entries.values()]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,77 @@
+"""
+Process-wide cache of rendered folium map HTML
+
+Building a folium.Map and serializing it to HTML is the slowest step of the
+Nearest Hospitals page. The HTML only depends on the map parameters and the
+markers drawn, so it is rendered once per distinct (parameters, marker set)
+and reused by every session until evicted.
+"""
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from codebase.lru_cache import LRUCache
+
+MAX_ENTRIES = 128
+MAP_WIDTH = 700
+MAP_HEIGHT = 500
+
+
+def frame_fingerprint(df, columns=None):
+    """Returns a short content hash of the rows (and column names) of df"""
+    if df is None:
+        return None
+    if columns is not None:
+        df = df[[column for column in columns if column in df.columns]]
+    sha = hashlib.sha256(",".join(map(str, df.columns)).encode("utf-8"))
+    sha.update(np.ascontiguousarray(pd.util.hash_pandas_object(df, index=False).to_numpy()).tobytes())
+    return sha.hexdigest()[:16]
+
+
+def map_key(**params):
+    """Returns a stable key for JSON-serializable map parameters"""
+    payload = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MapHtmlCache(LRUCache):
+    """LRU cache of rendered map HTML"""
+
+    def __init__(self, max_size=MAX_ENTRIES):
+        super().__init__(max_size)
+
+    def get_or_render(self, key, build):
+        """
+        Returns the HTML stored under key, calling build() -> folium.Map and
+        rendering it on a miss. Concurrent misses for the same key render once.
+        """
+        return self.get_or_build(key, lambda: render_map(build()))
+
+    def stats(self):
+        stats = super().stats()
+        stats['bytes'] = sum(len(html) for html in self.values())
+        return stats
+
+
+def render_map(fmap):
+    """Serializes a folium.Map to a standalone HTML document"""
+    return fmap.get_root().render()
+
+
+_cache = MapHtmlCache()
+
+
+def get_map_cache():
+    return _cache
+
+
+def get_map_html(build, markers=None, **params):
+    """
+    Returns the cached HTML of the map build() produces. params are the map
+    parameters (center, zoom, query...) and markers the DataFrame of points
+    drawn on it, both part of the key.
+    """
+    key = map_key(markers=frame_fingerprint(markers), **params)
+    return _cache.get_or_render(key, build)
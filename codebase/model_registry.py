@@ -0,0 +1,117 @@
+"""
+Process-wide registry for the prediction models
+
+A model is loaded from its memory-mapped <model>.tables/ directory (see
+codebase.tree_compiler) when one exists for the current pickle, and from
+the pickle itself otherwise.
+"""
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+
+from codebase.tracing import traced
+from codebase.tree_compiler import (MANIFEST_NAME, TablesError, file_sha256, load_tables, read_manifest,
+                                    tables_path)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_entries = {}
+
+
+class ModelEntry:
+    """A loaded model together with the file state it was loaded from"""
+
+    __slots__ = ("path", "signature", "digest", "source", "model")
+
+    def __init__(self, path, signature, digest, source, model):
+        self.path = path
+        self.signature = signature
+        self.digest = digest
+        self.source = source
+        self.model = model
+
+
+def load_pickle(path):
+    """Unpickles the scikit-learn estimator stored at path"""
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _signature(key):
+    """(mtime, size) of the pickle and of the tables manifest"""
+    return _stat(key), _stat(tables_path(key) / MANIFEST_NAME)
+
+
+@traced("model.load")
+def _load(key, signature):
+    """Returns (digest, source, model), preferring up-to-date tables over the pickle"""
+    pickle_state, manifest_state = signature
+    if pickle_state is None and manifest_state is None:
+        raise FileNotFoundError(key)
+    digest = file_sha256(key) if pickle_state is not None else None
+
+    if manifest_state is not None:
+        tables = tables_path(key)
+        try:
+            manifest = read_manifest(tables)
+            if manifest is not None and digest in (None, manifest['source_sha256']):
+                return manifest['source_sha256'], "tables", load_tables(tables)
+            if manifest is not None:
+                logger.warning("Ignoring stale %s: built from a different %s; loading the pickle",
+                               tables, Path(key).name)
+        except (TablesError, OSError) as e:
+            if digest is None:
+                raise
+            logger.warning("Ignoring %s: %s; loading the pickle", tables, e)
+    return digest, "pickle", load_pickle(key)
+
+
+def get_model_entry(path):
+    """
+    Returns the ModelEntry for the model stored at path.
+
+    The model is loaded once per process. Later calls only stat the files;
+    when the pickle or the tables change the pickle is hashed and the model
+    is reloaded only if the content actually differs.
+    """
+    key = str(Path(path).resolve())
+    signature = _signature(key)
+    entry = _entries.get(key)
+    if entry is not None and entry.signature == signature:
+        return entry
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry.signature == signature:
+            return entry
+
+        if (entry is not None and entry.source == "pickle" and signature[1] is None
+                and signature[0] is not None and file_sha256(key) == entry.digest):
+            # Touched but unchanged, keep the loaded estimator
+            entry = ModelEntry(key, signature, entry.digest, entry.source, entry.model)
+        else:
+            entry = ModelEntry(key, signature, *_load(key, signature))
+        _entries[key] = entry
+        return entry
+
+
+def get_model(path):
+    """Returns the shared model loaded from path"""
+    return get_model_entry(path).model
+
+
+def clear_registry():
+    """Forgets every loaded model so the next lookup reloads from disk"""
+    with _lock:
+        _entries.clear()
@@ -0,0 +1,62 @@
+"""
+Process-wide cache of model predictions
+
+Entries are keyed on the model's content digest and the normalized feature
+row, so promoting a new model never serves predictions from the old one.
+The cache is bounded (least recently used entries are evicted first), each
+entry expires after a TTL, and it is shared by every Streamlit session in
+the process.
+"""
+import time
+
+import numpy as np
+
+from codebase.lru_cache import LRUCache
+from codebase.model_registry import get_model_entry
+from codebase.tracing import span
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_TTL = 60 * 60  # seconds
+
+
+class PredictionCache(LRUCache):
+    """LRU cache of predictions whose entries expire after ttl seconds"""
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, ttl=DEFAULT_TTL, clock=time.monotonic):
+        super().__init__(max_size, ttl=ttl, clock=clock)
+
+
+_cache = PredictionCache()
+_MISSING = object()
+
+
+def get_prediction_cache():
+    """Returns the cache shared by every session in this process"""
+    return _cache
+
+
+def feature_key(row):
+    """Returns a hashable key for one feature row (adding 0.0 folds -0.0 into 0.0)"""
+    return tuple((np.asarray(row, dtype=np.float64) + 0.0).tolist())
+
+
+def predict_cached(model_path, X, cache=None):
+    """
+    Returns model.predict(X) for the model registered at model_path, serving
+    rows seen before from the cache and predicting the rest in one call.
+    X should already be validated (see codebase.feature_schema).
+    """
+    cache = _cache if cache is None else cache
+    entry = get_model_entry(model_path)
+    X = np.asarray(X, dtype=np.float64)
+
+    keys = [(entry.digest, feature_key(row)) for row in X]
+    results = [cache.get(key, _MISSING) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is _MISSING]
+    if missing:
+        with span("model.predict"):
+            predictions = entry.model.predict(X[missing])
+        for i, prediction in zip(missing, predictions.tolist()):
+            cache.put(keys[i], prediction)
+            results[i] = prediction
+    return np.array(results)
@@ -0,0 +1,79 @@
+"""
+Trimester calendar shown on the Home page
+
+Dates are handled as NumPy datetime64[D] arrays; pandas is deliberately not
+imported so the Home page does not pay for it.
+"""
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
+
+from codebase.tracing import traced
+
+TRIMESTER_COLORS = np.array([
+    'rgba(135, 206, 235, 0.3)',  # Light blue for first trimester
+    'rgba(221, 160, 221, 0.3)',  # Light purple for second trimester
+    'rgba(255, 182, 193, 0.3)',  # Light pink for third trimester
+])
+TODAY_BORDER = '3px solid #FF69B4'
+DEFAULT_BORDER = '1px solid #444'
+
+MONTH_TEMPLATE = ('<h3>{title}</h3>'
+                  '<table style="width: 100%; border-collapse: collapse;">'
+                  '<tr><th>Mon</th><th>Tue</th><th>Wed</th><th>Thu</th><th>Fri</th><th>Sat</th><th>Sun</th></tr>'
+                  '{rows}</table>')
+DAY_TEMPLATE = '<td style="padding: 10px; border: {border}; background-color: {color};">{day}</td>'
+EMPTY_CELL = f'<td style="padding: 10px; border: {DEFAULT_BORDER};"></td>'
+
+
+def _as_date(value):
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+@traced("home.calendar")
+def render_pregnancy_calendar(today, due_date, first_trimester_end, second_trimester_end):
+    """
+    Returns the HTML for one calendar table per month from today's month
+    through the due date's month, with each day coloured by trimester and
+    today highlighted. Dates may be date, datetime or 'YYYY-MM-DD' values.
+    """
+    return _render(_as_date(today), _as_date(due_date),
+                   _as_date(first_trimester_end), _as_date(second_trimester_end))
+
+
+@lru_cache(maxsize=256)
+def _render(today, due_date, first_end, second_end):
+    start = today.replace(day=1)
+    if due_date < start:
+        return ''
+
+    # Whole months, so the grid always starts on the 1st and ends on the last day
+    end = (np.datetime64(due_date, 'M') + 1).astype('datetime64[D]')
+    values = np.arange(np.datetime64(start, 'D'), end)
+
+    trimester = np.select(
+        [values <= np.datetime64(first_end), values <= np.datetime64(second_end)], [0, 1], 2)
+    colors = TRIMESTER_COLORS[trimester]
+    borders = np.where(values == np.datetime64(today), TODAY_BORDER, DEFAULT_BORDER)
+    day_numbers = (values - values.astype('datetime64[M]')).astype(np.int64) + 1
+    # Monday = 0; day 0 of the epoch (1970-01-01) was a Thursday
+    weekdays = (values.astype(np.int64) + 3) % 7
+    month_starts = np.flatnonzero(day_numbers == 1).tolist() + [len(values)]
+
+    months = []
+    for first, last in zip(month_starts, month_starts[1:]):
+        # Blank cells before the 1st and after the last day fill out the week rows
+        leading = int(weekdays[first])
+        trailing = (-(leading + last - first)) % 7
+        cells = [EMPTY_CELL] * leading
+        cells.extend(DAY_TEMPLATE.format(border=borders[i], color=colors[i], day=day_numbers[i])
+                     for i in range(first, last))
+        cells.extend([EMPTY_CELL] * trailing)
+        rows = ''.join('<tr>' + ''.join(cells[i:i + 7]) + '</tr>' for i in range(0, len(cells), 7))
+        months.append(MONTH_TEMPLATE.format(title=values[first].item().strftime('%B %Y'), rows=rows))
+    return ''.join(months)
@@ -0,0 +1,88 @@
+"""
+Global CSS theme served as a content-hashed stylesheet
+
+styles/*.css is concatenated and minified once per process. The inference
+service (codebase.inference_server) serves the result at
+/static/theme.<hash>.css as text/css with a one-year immutable
+Cache-Control, so a rerun only has to send a <link> to it. A CSS change
+produces a new hash and therefore a new URL.
+
+Set HEY_MUMMA_STATIC_URL to the service's base URL as the browser reaches
+it. Without it the minified CSS is inlined on every rerun instead.
+Streamlit's own app/static/ route cannot serve the file, because it sends
+anything but images as text/plain with nosniff and browsers reject that.
+
+Print the minified CSS with:
+    python -m codebase.theme
+"""
+import hashlib
+import re
+import threading
+from pathlib import Path
+
+STYLE_DIR = Path(__file__).parent.parent / "styles"
+STATIC_PREFIX = "/static/"
+HASH_LENGTH = 12
+
+_lock = threading.Lock()
+_compiled = None
+
+
+class CompiledTheme:
+    __slots__ = ("css", "digest", "data")
+
+    def __init__(self, css, digest):
+        self.css = css
+        self.digest = digest
+        self.data = css.encode("utf-8")
+
+    @property
+    def filename(self):
+        return f"theme.{self.digest}.css"
+
+    @property
+    def path(self):
+        """URL path of the stylesheet on the inference service"""
+        return f"{STATIC_PREFIX}{self.filename}"
+
+
+def minify(css):
+    """Drops comments and redundant whitespace"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def compile_theme(style_dir=STYLE_DIR):
+    """Returns the minified contents of style_dir/*.css with their content hash"""
+    css = minify("\n".join(path.read_text() for path in sorted(Path(style_dir).glob("*.css"))))
+    return CompiledTheme(css, hashlib.sha256(css.encode("utf-8")).hexdigest()[:HASH_LENGTH])
+
+
+def get_theme():
+    """Returns the theme compiled once per process"""
+    global _compiled
+    if _compiled is None:
+        with _lock:
+            if _compiled is None:
+                _compiled = compile_theme()
+    return _compiled
+
+
+def theme_html(static_url=None):
+    """
+    Returns the markup injected on every rerun: a <link> to the hashed
+    stylesheet when static_url (the inference service's public base URL)
+    is set, and the minified CSS inline otherwise
+    """
+    theme = get_theme()
+    if static_url:
+        return f'<link rel="stylesheet" href="{static_url.rstrip("/")}{theme.path}">'
+    return f"<style>{theme.css}</style>"
+
+
+if __name__ == "__main__":
+    theme = compile_theme()
+    print(f"/* {theme.path}, {len(theme.data)} bytes */")
+    print(theme.css)
@@ -0,0 +1,146 @@
+"""
+Lightweight timing spans with per-span latency histograms
+
+Tracing is off unless the HEY_MUMMA_TRACING environment variable is set
+(e.g. HEY_MUMMA_TRACING=1) when the process starts. While it is off, span()
+returns a shared no-op context manager and @traced returns the function
+unchanged, so instrumented code pays almost nothing.
+
+    with span("page.Dashboard"):
+        ...
+
+    @traced("db.get_user_info")
+    def get_user_info(email): ...
+
+Recorded histograms are shared by every session in the process and can be
+exported with export_json() or export_prometheus().
+"""
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+ENABLED = os.environ.get("HEY_MUMMA_TRACING", "").lower() not in ("", "0", "false", "no")
+
+# Upper bounds in seconds; the last bucket catches everything slower
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_histograms = {}
+_NOOP = nullcontext()
+
+
+class Histogram:
+    """Bucketed latency counts for one span name"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def cumulative(self):
+        """Returns [(upper bound, count of observations <= bound)] including +Inf"""
+        running, result = 0, []
+        for bound, count in zip(BUCKETS + (float("inf"),), self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+def record(name, seconds):
+    """Adds one observation to the histogram of span name"""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+
+class _Span:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def span(name):
+    """Returns a context manager that times its block under name"""
+    return _Span(name) if ENABLED else _NOOP
+
+
+def traced(name=None):
+    """Decorator that times every call of the function (named after it by default)"""
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(span_name, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def snapshot():
+    """Returns {span name: summary dict} for every recorded span"""
+    with _lock:
+        return {
+            name: {
+                'count': histogram.count,
+                'total_seconds': histogram.total,
+                'mean_seconds': histogram.total / histogram.count,
+                'max_seconds': histogram.max,
+                'buckets': [['+Inf' if bound == float("inf") else bound, count]
+                            for bound, count in histogram.cumulative()],
+            }
+            for name, histogram in sorted(_histograms.items())
+        }
+
+
+def export_json():
+    return json.dumps({'enabled': ENABLED, 'spans': snapshot()}, indent=2)
+
+
+def export_prometheus(metric="hey_mumma_span_duration_seconds"):
+    """Returns the histograms in the Prometheus text exposition format"""
+    lines = [f"# HELP {metric} Time spent in instrumented code paths.",
+             f"# TYPE {metric} histogram"]
+    for name, summary in snapshot().items():
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        for bound, count in summary['buckets']:
+            lines.append(f'{metric}_bucket{{span="{label}",le="{bound}"}} {count}')
+        lines.append(f'{metric}_sum{{span="{label}"}} {summary["total_seconds"]:.9f}')
+        lines.append(f'{metric}_count{{span="{label}"}} {summary["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Drops every recorded observation"""
+    with _lock:
+        _histograms.clear()
@@ -0,0 +1,211 @@
+"""
+Compiles fitted decision trees into flat NumPy lookup tables
+
+The tables are saved as a <model>.tables/ directory next to the pickle: one
+.npy file per array plus a manifest.json with the sha256 of every file and
+of the pickle they were compiled from. Loading memory-maps the arrays with
+allow_pickle=False, so no code runs on load and worker processes share the
+same pages.
+
+Usage:
+    python -m codebase.tree_compiler model/finalized_maternal_model.sav [out_dir]
+"""
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+TABLES_FORMAT = 1
+TABLES_SUFFIX = ".tables"
+MANIFEST_NAME = "manifest.json"
+ARRAY_NAMES = ('feature', 'threshold', 'left', 'right', 'leaf_class', 'proba', 'classes')
+
+
+class TablesError(ValueError):
+    """Tree tables are missing, of an unknown format or fail their checksum"""
+
+
+class CompiledTree:
+    """
+    A decision tree flattened into NumPy arrays.
+
+    Leaves point back to themselves, so every row can be advanced for a fixed
+    number of steps (the tree depth) without tracking which rows are done.
+    Exposes the predict/predict_proba/classes_/n_features_in_ subset of the
+    scikit-learn estimator interface used by the app.
+    """
+
+    def __init__(self, feature, threshold, left, right, leaf_class, proba, classes, n_features, depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.leaf_class = leaf_class
+        self.proba = proba
+        self.classes_ = classes
+        self.n_features_in_ = int(n_features)
+        self.depth = int(depth)
+
+    def _leaves(self, X):
+        # scikit-learn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[-1]} features, but the model expects {self.n_features_in_}")
+
+        leaves = np.empty(len(X), dtype=np.intp)
+        for start in range(0, len(X), DEFAULT_CHUNK_SIZE):
+            chunk = X[start:start + DEFAULT_CHUNK_SIZE]
+            rows = np.arange(len(chunk))
+            node = np.zeros(len(chunk), dtype=np.intp)
+            for _ in range(self.depth):
+                go_left = chunk[rows, self.feature[node]] <= self.threshold[node]
+                node = np.where(go_left, self.left[node], self.right[node])
+            leaves[start:start + len(chunk)] = node
+        return leaves
+
+    def predict(self, X):
+        return self.classes_[self.leaf_class[self._leaves(X)]]
+
+    def predict_proba(self, X):
+        return self.proba[self._leaves(X)]
+
+    def to_arrays(self):
+        """Returns the tables as a dict of plain arrays"""
+        return {
+            'feature': self.feature,
+            'threshold': self.threshold,
+            'left': self.left,
+            'right': self.right,
+            'leaf_class': self.leaf_class,
+            'proba': self.proba,
+            'classes': self.classes_,
+            'n_features': np.array(self.n_features_in_),
+            'depth': np.array(self.depth),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        return cls(arrays['feature'], arrays['threshold'], arrays['left'], arrays['right'],
+                   arrays['leaf_class'], arrays['proba'], arrays['classes'],
+                   arrays['n_features'], arrays['depth'])
+
+
+def compile_tree(model):
+    """Flattens a fitted DecisionTreeClassifier into a CompiledTree"""
+    tree = model.tree_
+    n_nodes = tree.node_count
+    node_ids = np.arange(n_nodes, dtype=np.int32)
+    is_leaf = tree.children_left == -1
+
+    feature = np.where(is_leaf, 0, tree.feature).astype(np.int32)
+    threshold = np.where(is_leaf, np.inf, tree.threshold).astype(np.float64)
+    left = np.where(is_leaf, node_ids, tree.children_left).astype(np.int32)
+    right = np.where(is_leaf, node_ids, tree.children_right).astype(np.int32)
+
+    values = tree.value[:, 0, :].astype(np.float64)
+    totals = values.sum(axis=1, keepdims=True)
+    proba = np.divide(values, totals, out=np.zeros_like(values), where=totals > 0)
+    leaf_class = values.argmax(axis=1).astype(np.int32)
+
+    return CompiledTree(feature, threshold, left, right, leaf_class, proba,
+                        np.asarray(model.classes_), model.n_features_in_, tree.max_depth)
+
+
+def file_sha256(path, block_size=DEFAULT_CHUNK_SIZE):
+    """Returns the sha256 hex digest of a file, read in blocks"""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def tables_path(model_path):
+    """Returns the tables directory for a pickled model"""
+    return Path(model_path).with_suffix(TABLES_SUFFIX)
+
+
+def read_manifest(tables_dir):
+    """Returns the manifest of a tables directory, or None if there is none"""
+    try:
+        manifest = json.loads((Path(tables_dir) / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        raise TablesError(f"Unreadable manifest in {tables_dir}: {e}")
+    if manifest.get('format') != TABLES_FORMAT:
+        raise TablesError(f"Unsupported tables format {manifest.get('format')} in {tables_dir}")
+    return manifest
+
+
+def export_tables(model_path, out_dir=None):
+    """
+    Compiles the pickled tree at model_path and writes its tables to
+    <model>.tables/. The manifest is written last, so a partially written
+    directory is never picked up. Returns the output directory.
+    """
+    from codebase.model_registry import load_pickle
+
+    out_dir = Path(out_dir) if out_dir else tables_path(model_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    compiled = compile_tree(load_pickle(model_path))
+    arrays = compiled.to_arrays()
+
+    checksums = {}
+    for name in ARRAY_NAMES:
+        path = out_dir / f"{name}.npy"
+        np.save(path, np.ascontiguousarray(arrays[name]), allow_pickle=False)
+        checksums[name] = file_sha256(path)
+
+    manifest = {
+        'format': TABLES_FORMAT,
+        'source_sha256': file_sha256(model_path),
+        'n_features': compiled.n_features_in_,
+        'depth': compiled.depth,
+        'arrays': checksums,
+    }
+    tmp = out_dir / (MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, out_dir / MANIFEST_NAME)
+    return out_dir
+
+
+def load_tables(path, verify=True):
+    """
+    Loads a CompiledTree written by export_tables with memory-mapped,
+    read-only arrays (no pickle involved). Raises TablesError when the
+    directory is incomplete or, with verify, a file fails its checksum.
+    Legacy single-file .npz tables are still accepted.
+    """
+    path = Path(path)
+    if path.suffix == '.npz':
+        with np.load(path, allow_pickle=False) as data:
+            return CompiledTree.from_arrays({key: data[key] for key in data.files})
+
+    manifest = read_manifest(path)
+    if manifest is None:
+        raise TablesError(f"No {MANIFEST_NAME} in {path}")
+    arrays = {}
+    for name in ARRAY_NAMES:
+        array_path = path / f"{name}.npy"
+        expected = manifest['arrays'].get(name)
+        if not array_path.exists() or expected is None:
+            raise TablesError(f"{path} is missing the '{name}' table")
+        if verify and file_sha256(array_path) != expected:
+            raise TablesError(f"Checksum mismatch for {array_path}")
+        arrays[name] = np.load(array_path, mmap_mode='r', allow_pickle=False)
+    arrays['n_features'] = manifest['n_features']
+    arrays['depth'] = manifest['depth']
+    return CompiledTree.from_arrays(arrays)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m codebase.tree_compiler <model.sav> [out_dir]")
+        sys.exit(1)
+    path = export_tables(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"Tree tables written to {path}")
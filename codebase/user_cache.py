@@ -0,0 +1,28 @@
+"""
+Per-session cache of user profiles
+"""
+from database.database import get_user_info
+
+CACHE_KEY = '_user_profile_cache'
+
+
+def get_cached_user_info(session_state, email):
+    """
+    Returns the profile for email (including profile_completed), reading it
+    from the database only on the first call in this session
+    """
+    cache = session_state.setdefault(CACHE_KEY, {})
+    if email not in cache:
+        cache[email] = get_user_info(email)
+    return cache[email]
+
+
+def invalidate_user_info(session_state, email=None):
+    """Drops the cached profile for email, or every cached profile"""
+    cache = session_state.get(CACHE_KEY)
+    if not cache:
+        return
+    if email is None:
+        cache.clear()
+    else:
+        cache.pop(email, None)
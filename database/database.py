@@ -1,239 +1,225 @@
 import sqlite3
 import datetime
 from pathlib import Path
+from contextlib import contextmanager
 import os
+import queue
+import threading
 import time
 
+from codebase.tracing import traced
+
+POOL_SIZE = 8
+STATEMENT_CACHE_SIZE = 128
+
 def get_db_path():
-    return Path(__file__).parent / "users.db"
+    return Path(os.environ.get("HEY_MUMMA_DB", Path(__file__).parent / "users.db"))
+
+class ConnectionPool:
+    """
+    Thread-safe pool of SQLite connections.
+
+    A connection is only ever used by the thread that checked it out, and is
+    returned to the pool afterwards so connection setup and PRAGMAs are paid
+    once per connection instead of once per query. Each connection keeps its
+    own prepared statement cache.
+    """
+
+    def __init__(self, db_path, size=POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=30000')
+        return conn
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        healthy = True
+        try:
+            yield conn
+        except BaseException:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                # Not safe to hand out again
+                healthy = False
+            raise
+        finally:
+            self._release(conn, healthy)
+
+    def _release(self, conn, healthy):
+        if healthy:
+            try:
+                self._idle.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
+
+    def close_all(self):
+        """Closes every idle connection, e.g. before the database file is replaced"""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+_pool = ConnectionPool(get_db_path())
+
+USER_COLUMNS = ('email', 'name', 'age', 'height', 'weight', 'pregnancies', 'due_date',
+                'registration_date', 'profile_completed')
+
+def close_connections():
+    _pool.close_all()
+
+def _create_users_table(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS users
+                    (email TEXT PRIMARY KEY,
+                     name TEXT NOT NULL,
+                     password TEXT NOT NULL,
+                     age INTEGER,
+                     height REAL,
+                     weight REAL,
+                     pregnancies INTEGER,
+                     due_date TEXT,
+                     registration_date TEXT)''')
+
+def _add_profile_completed(conn):
+    # Databases created before versioning may already have the column
+    columns = [row[1] for row in conn.execute('PRAGMA table_info(users)')]
+    if 'profile_completed' not in columns:
+        conn.execute('ALTER TABLE users ADD COLUMN profile_completed INTEGER DEFAULT 0')
+    conn.execute('''UPDATE users SET profile_completed = 1
+                    WHERE age IS NOT NULL AND height IS NOT NULL AND weight IS NOT NULL
+                      AND pregnancies IS NOT NULL AND due_date IS NOT NULL''')
+
+# Schema migrations, applied in order. The schema version is the number of
+# migrations applied and is stored in PRAGMA user_version. Append new
+# migrations to the end; never edit or reorder existing ones.
+MIGRATIONS = [
+    _create_users_table,
+    _add_profile_completed,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+@traced("db.migrate")
+def migrate():
+    """Apply any pending migrations and return the resulting schema version"""
+    with _pool.connection() as conn:
+        # Take the write lock first so concurrent processes migrate one at a time
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for migration in MIGRATIONS[version:]:
+                migration(conn)
+            if version < SCHEMA_VERSION:
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    return max(version, SCHEMA_VERSION)
 
 def recreate_database():
     """Recreate the database with the current schema"""
     db_path = get_db_path()
     
-    # Try to delete the database if it exists
-    if db_path.exists():
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                os.remove(db_path)
-                break
-            except PermissionError:
-                if attempt < max_attempts - 1:
-                    time.sleep(1)  # Wait a bit before retrying
-                else:
-                    # If we can't delete, try to alter the existing table instead
-                    try:
-                        conn = sqlite3.connect(db_path)
-                        c = conn.cursor()
-                        
-                        # Add profile_completed column if it doesn't exist
-                        try:
-                            c.execute('ALTER TABLE users ADD COLUMN profile_completed INTEGER DEFAULT 0')
-                            conn.commit()
-                        except sqlite3.OperationalError:
-                            # Column might already exist
-                            pass
-                        
-                        conn.close()
-                        return
-                    except Exception:
-                        # If altering fails, we'll have to work with the existing schema
-                        return
-    
-    # Create new database
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+    # Release pooled connections so the file can be removed
+    close_connections()
     
-    # Create users table with all fields
-    c.execute('''CREATE TABLE users
-                 (email TEXT PRIMARY KEY,
-                  name TEXT NOT NULL,
-                  password TEXT NOT NULL,
-                  age INTEGER,
-                  height REAL,
-                  weight REAL,
-                  pregnancies INTEGER,
-                  due_date TEXT,
-                  registration_date TEXT,
-                  profile_completed INTEGER DEFAULT 0)''')
+    max_attempts = 3
+    for attempt in range(max_attempts):
+        try:
+            for path in (db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+                if path.exists():
+                    os.remove(path)
+            break
+        except PermissionError:
+            if attempt < max_attempts - 1:
+                time.sleep(1)  # Wait a bit before retrying
+            # Otherwise migrate the existing file in place
     
-    conn.commit()
-    conn.close()
+    migrate()
 
 def init_db():
-    """Initialize the database if it doesn't exist"""
-    db_path = get_db_path()
-    
-    if not db_path.exists():
-        recreate_database()
-    else:
-        # Check if the profile_completed column exists
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
-        
-        try:
-            c.execute('SELECT profile_completed FROM users LIMIT 1')
-            conn.close()
-        except sqlite3.OperationalError:
-            # Column doesn't exist, try to add it
-            conn.close()
-            try:
-                conn = sqlite3.connect(db_path)
-                c = conn.cursor()
-                c.execute('ALTER TABLE users ADD COLUMN profile_completed INTEGER DEFAULT 0')
-                conn.commit()
-            except sqlite3.OperationalError:
-                # If we can't alter the table, try to recreate the database
-                conn.close()
-                recreate_database()
-            finally:
-                if conn:
-                    conn.close()
+    """Initialize the database and bring its schema up to date"""
+    migrate()
 
+@traced("db.add_user")
 def add_user(email, name, password, age=None, height=None, weight=None, pregnancies=None, due_date=None):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    
-    try:
+    with _pool.connection() as conn:
         profile_completed = 1 if all(x is not None for x in [age, height, weight, pregnancies, due_date]) else 0
         
-        # Check if profile_completed column exists
         try:
-            c.execute('SELECT profile_completed FROM users LIMIT 1')
-        except sqlite3.OperationalError:
-            # Add the column if it doesn't exist
-            c.execute('ALTER TABLE users ADD COLUMN profile_completed INTEGER DEFAULT 0')
+            conn.execute('''INSERT INTO users 
+                            (email, name, password, age, height, weight, pregnancies, due_date, registration_date, profile_completed)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                         (email, name, password, age, height, weight, pregnancies, due_date, 
+                          datetime.datetime.now().strftime('%Y-%m-%d'), profile_completed))
             conn.commit()
-        
-        c.execute('''INSERT INTO users 
-                     (email, name, password, age, height, weight, pregnancies, due_date, registration_date, profile_completed)
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                 (email, name, password, age, height, weight, pregnancies, due_date, 
-                  datetime.datetime.now().strftime('%Y-%m-%d'), profile_completed))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        return False
-    finally:
-        conn.close()
+            return True
+        except sqlite3.IntegrityError:
+            conn.rollback()
+            return False
 
+@traced("db.verify_user")
 def verify_user(email, password):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    
-    c.execute('SELECT * FROM users WHERE email = ? AND password = ?', (email, password))
-    user = c.fetchone()
-    conn.close()
+    with _pool.connection() as conn:
+        c = conn.cursor()
+        
+        c.execute('SELECT * FROM users WHERE email = ? AND password = ?', (email, password))
+        user = c.fetchone()
     
     return user
 
+@traced("db.check_profile_completed")
 def check_profile_completed(email):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    
-    try:
-        # First check if the column exists
-        try:
-            c.execute('SELECT profile_completed FROM users WHERE email = ?', (email,))
-            result = c.fetchone()
-            return result and result[0] == 1
-        except sqlite3.OperationalError:
-            # If column doesn't exist, check if all profile fields are filled
-            c.execute('''SELECT age, height, weight, pregnancies, due_date 
-                        FROM users WHERE email = ?''', (email,))
-            result = c.fetchone()
-            return result and all(x is not None for x in result)
-    finally:
-        conn.close()
+    with _pool.connection() as conn:
+        result = conn.execute('SELECT profile_completed FROM users WHERE email = ?', (email,)).fetchone()
+    return bool(result) and result[0] == 1
 
+@traced("db.get_user_info")
 def get_user_info(email):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+    with _pool.connection() as conn:
+        user = conn.execute('''SELECT email, name, age, height, weight, pregnancies, due_date,
+                                   registration_date, profile_completed
+                            FROM users WHERE email = ?''', (email,)).fetchone()
     
-    try:
-        c.execute('SELECT * FROM users WHERE email = ?', (email,))
-        user = c.fetchone()
-        
-        if user:
-            # Get column names
-            columns = [description[0] for description in c.description]
-            user_dict = {
-                'email': user[columns.index('email')],
-                'name': user[columns.index('name')],
-                'age': user[columns.index('age')] if 'age' in columns else None,
-                'height': user[columns.index('height')] if 'height' in columns else None,
-                'weight': user[columns.index('weight')] if 'weight' in columns else None,
-                'pregnancies': user[columns.index('pregnancies')] if 'pregnancies' in columns else None,
-                'due_date': user[columns.index('due_date')] if 'due_date' in columns else None,
-                'registration_date': user[columns.index('registration_date')] if 'registration_date' in columns else None,
-            }
-            
-            # Add profile_completed if it exists
-            try:
-                user_dict['profile_completed'] = user[columns.index('profile_completed')]
-            except ValueError:
-                # If profile_completed column doesn't exist, calculate it
-                user_dict['profile_completed'] = 1 if all(user_dict[k] is not None for k in ['age', 'height', 'weight', 'pregnancies', 'due_date']) else 0
-            
-            return user_dict
-        return None
-    finally:
-        conn.close()
+    if user:
+        return dict(zip(USER_COLUMNS, user))
+    return None
 
+@traced("db.update_user_info")
 def update_user_info(email, age=None, height=None, weight=None, pregnancies=None, due_date=None):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+    fields = {'age': age, 'height': height, 'weight': weight,
+              'pregnancies': pregnancies, 'due_date': due_date}
+    updates = {name: value for name, value in fields.items() if value is not None}
+    if not updates:
+        return
     
-    try:
-        update_fields = []
-        values = []
-        
-        if age is not None:
-            update_fields.append('age = ?')
-            values.append(age)
-        if height is not None:
-            update_fields.append('height = ?')
-            values.append(height)
-        if weight is not None:
-            update_fields.append('weight = ?')
-            values.append(weight)
-        if pregnancies is not None:
-            update_fields.append('pregnancies = ?')
-            values.append(pregnancies)
-        if due_date is not None:
-            update_fields.append('due_date = ?')
-            values.append(due_date)
-        
-        if update_fields:
-            # Check if all profile fields are filled
-            c.execute('''SELECT age, height, weight, pregnancies, due_date 
-                         FROM users WHERE email = ?''', (email,))
-            current_data = c.fetchone()
-            
-            # Update profile_completed status
-            if current_data and all(x is not None for x in current_data):
-                # Check if profile_completed column exists
-                try:
-                    c.execute('SELECT profile_completed FROM users LIMIT 1')
-                    update_fields.append('profile_completed = 1')
-                except sqlite3.OperationalError:
-                    # Add the column if it doesn't exist
-                    c.execute('ALTER TABLE users ADD COLUMN profile_completed INTEGER DEFAULT 0')
-                    update_fields.append('profile_completed = 1')
-                    conn.commit()
-            
-            values.append(email)
-            query = f'''UPDATE users SET {', '.join(update_fields)} WHERE email = ?'''
-            c.execute(query, values)
-            conn.commit()
-    finally:
-        conn.close()
+    # Mark the profile complete in the same statement once every field is filled in
+    completed = ' AND '.join(f'COALESCE(?, {name}) IS NOT NULL' for name in fields)
+    query = f'''UPDATE users SET {', '.join(f'{name} = ?' for name in updates)},
+                 profile_completed = CASE WHEN {completed} THEN 1 ELSE profile_completed END
+                 WHERE email = ?'''
+    values = list(updates.values()) + list(fields.values()) + [email]
+    
+    with _pool.connection() as conn:
+        conn.execute(query, values)
+        conn.commit()
 
-# Initialize or migrate the database
-init_db()
+# Apply schema migrations once per process
+migrate()
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# database.database migrates its database on import; keep that off the tracked users.db
+os.environ.setdefault("HEY_MUMMA_DB", os.path.join(tempfile.mkdtemp(prefix="hey-mumma-"), "users.db"))
@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from codebase.batch_prediction import predict_batch
+from codebase.feature_schema import SchemaError, get_validator
+from codebase.model_registry import get_model
+
+MODEL = "model/finalized_maternal_model.sav"
+
+
+def test_batch_rejects_the_rows_the_form_rejects():
+    validate = get_validator(MODEL)
+    roster = pd.DataFrame({
+        'age': [30, 30, 30, 30],  # column names match case-insensitively
+        'DiastolicBP': [80, 80, 80, 80],
+        'BS': [7.0, -1.5, 7.0, 7.0],
+        'BodyTemp': [98.0, 98.0, 37.0, None],  # 37 is Celsius, outside the Fahrenheit range
+        'HeartRate': [70, 70, 70, 70],
+    })
+
+    result = predict_batch(get_model(MODEL), roster, schema=validate.schema)
+
+    assert result['predicted_risk'].notna().tolist() == [True, True, False, False]
+    for i, row in roster.rename(columns={'age': 'Age'}).iterrows():
+        if result['error'][i]:
+            with pytest.raises(SchemaError, match=result['error'][i].split(' (')[0]):
+                validate(row.to_dict())
+        else:
+            validate(row.to_dict())
+    assert result['error'][2].startswith("Body temperature must be between")
+
+
+def test_missing_column_raises_schema_error():
+    validate = get_validator(MODEL)
+    with pytest.raises(SchemaError, match="BodyTemp"):
+        predict_batch(get_model(MODEL), pd.DataFrame({'Age': [30]}), schema=validate.schema)
@@ -0,0 +1,28 @@
+import sqlite3
+
+import pytest
+
+from database.database import ConnectionPool
+
+
+def test_connection_is_returned_after_an_error(tmp_path):
+    pool = ConnectionPool(tmp_path / "users.db", size=1)
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.connection() as conn:
+            conn.execute("SELECT * FROM missing")
+
+    assert pool._idle.qsize() == 1
+    with pool.connection() as reused:
+        assert reused is conn
+        assert reused.execute("SELECT 1").fetchone() == (1,)
+    pool.close_all()
+
+
+def test_connection_is_closed_when_rollback_fails(tmp_path):
+    pool = ConnectionPool(tmp_path / "users.db", size=1)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.close()
+            raise RuntimeError("boom")
+
+    assert pool._idle.empty()
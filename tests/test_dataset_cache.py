@@ -0,0 +1,41 @@
+import threading
+import time
+
+from codebase.dataset_cache import DatasetCache, FileSource
+
+
+class SlowFileSource(FileSource):
+    """A FileSource whose fetches take `delay` seconds once slow is set"""
+
+    def __init__(self, path, delay):
+        super().__init__(path)
+        self.delay = delay
+        self.slow = threading.Event()
+
+    def fetch(self, etag=None, last_modified=None):
+        if self.slow.is_set():
+            time.sleep(self.delay)
+        return super().fetch(etag, last_modified)
+
+
+def test_stale_get_does_not_wait_for_the_background_refresh(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("x\n1\n")
+    source = SlowFileSource(path, delay=1.5)
+    cache = DatasetCache("slow", source, ttl=0.2, snapshot_dir=None)
+    first = cache.get()
+
+    path.write_text("x\n2\n")
+    source.slow.set()
+    time.sleep(0.3)
+    started = time.perf_counter()
+    stale = [cache.get() for _ in range(3)]  # the first one starts the refresh
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert all(dataset is first for dataset in stale)
+
+    deadline = time.time() + 5
+    while cache.get().version == first.version and time.time() < deadline:
+        time.sleep(0.05)
+    assert cache.get().df['x'].tolist() == [2]
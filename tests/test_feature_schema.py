@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from codebase.feature_schema import SchemaError, compile_validator, get_validator, schema_for
+from train_pipeline import PIPELINES
+
+
+@pytest.mark.parametrize('name', sorted(PIPELINES))
+def test_training_data_passes_the_model_schema(name):
+    # The validator shared by training and inference must accept the data the model was fitted on
+    pipeline = PIPELINES[name]
+    df = pd.read_csv(pipeline['data'])
+    validate = get_validator(f"model/{pipeline['artifact']}")
+    X = validate(df)
+    np.testing.assert_array_equal(X, df[validate.schema.names].to_numpy(dtype=np.float64))
+
+
+@pytest.mark.parametrize('data', [5, 3.2, None])
+def test_unsized_input_raises_schema_error(data):
+    validate = compile_validator(schema_for('maternal', ['Age', 'DiastolicBP', 'BS', 'BodyTemp', 'HeartRate']))
+    with pytest.raises(SchemaError):
+        validate(data)
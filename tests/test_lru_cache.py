@@ -0,0 +1,49 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from codebase.lru_cache import LRUCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl():
+    now = [0.0]
+    cache = LRUCache(max_size=10, ttl=5, clock=lambda: now[0])
+    cache.put("a", 1)
+    now[0] = 4.9
+    assert cache.get("a") == 1
+    now[0] = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_concurrent_misses_build_once():
+    cache = LRUCache(max_size=10)
+    calls = []
+    start = threading.Barrier(8)
+
+    def build():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    def worker():
+        start.wait()
+        return cache.get_or_build("key", build)
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: worker(), range(8)))
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
@@ -0,0 +1,40 @@
+import logging
+import pickle
+import shutil
+
+from codebase import model_registry
+from codebase.tree_compiler import export_tables, tables_path
+
+MODEL = "model/finalized_maternal_model.sav"
+
+
+def test_stale_tables_fall_back_to_the_pickle_with_a_warning(tmp_path, caplog):
+    model_path = tmp_path / "model.sav"
+    shutil.copyfile(MODEL, model_path)
+    export_tables(model_path)
+    # Same estimator, different bytes: the tables no longer match the pickle
+    with open(MODEL, "rb") as f:
+        model = pickle.load(f)
+    with open(model_path, "wb") as f:
+        pickle.dump(model, f, protocol=2)
+
+    model_registry.clear_registry()
+    with caplog.at_level(logging.WARNING, logger="codebase.model_registry"):
+        entry = model_registry.get_model_entry(model_path)
+
+    assert entry.source == "pickle"
+    assert str(tables_path(model_path)) in caplog.text
+    assert "stale" in caplog.text
+
+
+def test_matching_tables_are_loaded_without_a_warning(tmp_path, caplog):
+    model_path = tmp_path / "model.sav"
+    shutil.copyfile(MODEL, model_path)
+    export_tables(model_path)
+
+    model_registry.clear_registry()
+    with caplog.at_level(logging.WARNING, logger="codebase.model_registry"):
+        entry = model_registry.get_model_entry(model_path)
+
+    assert entry.source == "tables"
+    assert not caplog.records
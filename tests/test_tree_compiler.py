@@ -0,0 +1,60 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from codebase.model_registry import load_pickle
+from codebase.tree_compiler import compile_tree, export_tables, load_tables
+
+MODELS = ["model/finalized_maternal_model.sav", "model/fetal_health_classifier.sav"]
+
+
+def load_model(path):
+    with warnings.catch_warnings():
+        # The shipped pickles were saved by an older scikit-learn
+        warnings.simplefilter("ignore")
+        return load_pickle(path)
+
+
+def rows_around_thresholds(model, n_rows=5000, seed=0):
+    """Random rows spread around the splits, plus rows exactly on and either side of every threshold"""
+    rng = np.random.default_rng(seed)
+    tree = model.tree_
+    X = np.empty((n_rows, model.n_features_in_))
+    for f in range(model.n_features_in_):
+        thresholds = tree.threshold[tree.feature == f]
+        centre = thresholds.mean() if len(thresholds) else 0.0
+        spread = max(np.ptp(thresholds) if len(thresholds) else 1.0, 1.0)
+        X[:, f] = rng.normal(centre, spread, n_rows)
+
+    splits = np.flatnonzero(tree.children_left != -1)
+    edges = []
+    for offset in (None, -np.inf, np.inf):
+        rows = np.repeat(X[:1], len(splits), axis=0)
+        for row, node in zip(rows, splits):
+            # Features reach the tree as float32, so step to the float32 neighbours
+            value = np.float32(tree.threshold[node])
+            row[tree.feature[node]] = value if offset is None else np.nextafter(value, np.float32(offset))
+        edges.append(rows)
+    return np.vstack([X] + edges)
+
+
+@pytest.mark.parametrize("path", MODELS)
+def test_compiled_tree_matches_sklearn(path):
+    model = load_model(path)
+    compiled = compile_tree(model)
+    X = rows_around_thresholds(model)
+
+    assert np.array_equal(compiled.predict(X), model.predict(X))
+    assert np.allclose(compiled.predict_proba(X), model.predict_proba(X))
+
+
+@pytest.mark.parametrize("path", MODELS)
+def test_exported_tables_match_sklearn(path, tmp_path):
+    model = load_model(path)
+    out_dir = export_tables(path, tmp_path / "tables")
+    compiled = load_tables(out_dir)
+    X = rows_around_thresholds(model, seed=1)
+
+    assert np.array_equal(compiled.predict(X), model.predict(X))
+    assert np.allclose(compiled.predict_proba(X), model.predict_proba(X))
@@ -1,14 +1,69 @@
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.metrics import accuracy_score
 from sklearn.model_selection import train_test_split
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import cross_val_score, KFold
 from sklearn.ensemble import GradientBoostingClassifier
 import numpy as np
+import argparse
+import json
 import pickle
 import os
-import matplotlib.pyplot as plt
+from codebase.feature_schema import CTG_INPUTS, MATERNAL_INPUTS, FeatureSchema, save_schema
+from codebase.tree_compiler import export_tables
 
-def create_simple_maternal_model():
+PLOT_FORMATS = ('png', 'svg')
+
+def plot_accuracies(name, labels, accuracies, title, plot_dir=None, show=False):
+    """
+    Draws the accuracy bar and line charts.
+
+    Charts are written to plot_dir as PNG and SVG and/or shown in a window.
+    matplotlib is only imported when at least one of the two is requested.
+    """
+    if not plot_dir and not show:
+        return
+    
+    import matplotlib
+    if not show:
+        matplotlib.use('Agg')  # No display needed when only writing files
+    import matplotlib.pyplot as plt
+    
+    if plot_dir:
+        os.makedirs(plot_dir, exist_ok=True)
+    
+    def finish(fig, kind):
+        if plot_dir:
+            for fmt in PLOT_FORMATS:
+                fig.savefig(os.path.join(plot_dir, f"{name}_accuracy_{kind}.{fmt}"), bbox_inches='tight')
+        if show:
+            plt.show()
+        plt.close(fig)
+    
+    # Plotting the accuracies
+    fig = plt.figure()
+    plt.bar(labels, accuracies, color=['blue', 'orange', 'green'])
+    plt.ylabel('Accuracy (%)')
+    plt.title(title)
+    plt.ylim(0, 100)
+    finish(fig, 'bar')
+    
+    # Plotting in line graph
+    fig = plt.figure()
+    plt.plot(labels, accuracies, marker='o', color='purple')
+    plt.ylabel('Accuracy (%)')
+    plt.title(f"{title} - Line Graph")
+    plt.ylim(0, 100)
+    plt.grid()
+    finish(fig, 'line')
+
+def accuracy_metrics(training_accuracy, testing_accuracy, cv_scores):
+    return {
+        'training_accuracy': float(training_accuracy),
+        'testing_accuracy': float(testing_accuracy),
+        'cross_validation_accuracy': float(cv_scores.mean()),
+    }
+
+def create_simple_maternal_model(plot_dir=None, show_plots=False):
     """Create a simple maternal health model"""
     # Create a simple decision tree model
     model = DecisionTreeClassifier(max_depth=5, random_state=42)
@@ -67,27 +122,19 @@ def create_simple_maternal_model():
     os.makedirs('model', exist_ok=True)
     with open('model/finalized_maternal_model.sav', 'wb') as f:
         pickle.dump(model, f)
+    save_schema('model/finalized_maternal_model.sav', FeatureSchema('maternal', MATERNAL_INPUTS))
+    export_tables('model/finalized_maternal_model.sav')
     
     # Plotting the accuracies
     accuracies = [training_accuracy * 100, accuracy * 100, cv_scores.mean() * 100]
     labels = ['Training Accuracy', 'Testing Accuracy', 'Cross-Validation Accuracy']
-    plt.bar(labels, accuracies, color=['blue', 'orange', 'green'])
-    plt.ylabel('Accuracy (%)')
-    plt.title('Training vs Testing vs Cross-Validation Accuracy')
-    plt.ylim(0, 100)
-    plt.show()
-    
-    # Plotting in line graph
-    plt.plot(labels, accuracies, marker='o', color='purple')
-    plt.ylabel('Accuracy (%)')
-    plt.title('Training vs Testing vs Cross-Validation Accuracy - Line Graph')
-    plt.ylim(0, 100)
-    plt.grid()
-    plt.show()
+    plot_accuracies('simple_maternal', labels, accuracies,
+                    'Training vs Testing vs Cross-Validation Accuracy', plot_dir, show_plots)
     
     print("Maternal health model saved")
+    return accuracy_metrics(training_accuracy, accuracy, cv_scores)
 
-def create_maternal_prediction_model():
+def create_maternal_prediction_model(plot_dir=None, show_plots=False):
     """Create and evaluate the maternal prediction model"""
     model = DecisionTreeClassifier(max_depth=5, random_state=42)
     
@@ -132,21 +179,12 @@ def create_maternal_prediction_model():
     # Plotting the accuracies
     accuracies = [training_accuracy * 100, accuracy * 100, kf_scores.mean() * 100]
     labels = ['Training Accuracy', 'Testing Accuracy', 'K-Fold Cross-Validation Accuracy']
-    plt.bar(labels, accuracies, color=['blue', 'orange', 'green'])
-    plt.ylabel('Accuracy (%)')
-    plt.title('Maternal Prediction Model Accuracy')
-    plt.ylim(0, 100)
-    plt.show()
+    plot_accuracies('maternal_prediction', labels, accuracies,
+                    'Maternal Prediction Model Accuracy', plot_dir, show_plots)
     
-    # Plotting in line graph
-    plt.plot(labels, accuracies, marker='o', color='purple')
-    plt.ylabel('Accuracy (%)')
-    plt.title('Maternal Prediction Model Accuracy - Line Graph')
-    plt.ylim(0, 100)
-    plt.grid()
-    plt.show()
+    return accuracy_metrics(training_accuracy, accuracy, kf_scores)
 
-def create_simple_fetal_model():
+def create_simple_fetal_model(plot_dir=None, show_plots=False):
     """Create a simple fetal health model"""
     # Create a simple decision tree model
     model = DecisionTreeClassifier(max_depth=4, random_state=42)
@@ -176,33 +214,25 @@ def create_simple_fetal_model():
     accuracy = accuracy_score(y_test, predictions)
     print(f"Testing Accuracy: {accuracy * 100:.2f}%")
     
-    # Perform cross-validation
-    cv_scores = cross_val_score(model, X, y, cv=5)
+    # Perform cross-validation (one sample per class, so plain K-fold with at most one fold per sample)
+    cv_scores = cross_val_score(model, X, y, cv=KFold(n_splits=min(5, len(y))))
     print(f"Cross-Validation Accuracy: {cv_scores.mean() * 100:.2f}%")
     
     # Save the model
     os.makedirs('model', exist_ok=True)
     with open('model/fetal_health_classifier.sav', 'wb') as f:
         pickle.dump(model, f)
+    save_schema('model/fetal_health_classifier.sav', FeatureSchema('fetal', CTG_INPUTS[:X.shape[1]]))
+    export_tables('model/fetal_health_classifier.sav')
     
     # Plotting the accuracies
     accuracies = [training_accuracy * 100, accuracy * 100, cv_scores.mean() * 100]
     labels = ['Training Accuracy', 'Testing Accuracy', 'Cross-Validation Accuracy']
-    plt.bar(labels, accuracies, color=['blue', 'orange', 'green'])
-    plt.ylabel('Accuracy (%)')
-    plt.title('Fetal Health Model Accuracy')
-    plt.ylim(0, 100)
-    plt.show()
-    
-    # Plotting in line graph
-    plt.plot(labels, accuracies, marker='o', color='purple')
-    plt.ylabel('Accuracy (%)')
-    plt.title('Fetal Health Model Accuracy - Line Graph')
-    plt.ylim(0, 100)
-    plt.grid()
-    plt.show()
+    plot_accuracies('simple_fetal', labels, accuracies,
+                    'Fetal Health Model Accuracy', plot_dir, show_plots)
     
     print("Fetal health model saved")
+    return accuracy_metrics(training_accuracy, accuracy, cv_scores)
 
 def create_gradient_boosting_model():
     """Create and evaluate the Gradient Boosting model"""
@@ -245,11 +275,25 @@ def create_gradient_boosting_model():
     # Perform K-Fold cross-validation
     kf_scores = cross_val_score(model, X, y, cv=3)
     print(f"Gradient Boosting K-Fold Cross-Validation Accuracy: {kf_scores.mean() * 100:.2f}%")
+    
+    return accuracy_metrics(training_accuracy, accuracy, kf_scores)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create the Hey Mumma models")
+    parser.add_argument('--plot-dir', help="Write the accuracy charts as PNG and SVG to this directory")
+    parser.add_argument('--show', action='store_true', help="Show the accuracy charts in a window")
+    parser.add_argument('--metrics-json', help="Write the accuracy metrics of every model to this JSON file")
+    args = parser.parse_args()
+    
     print("Creating models...")
-    create_simple_maternal_model()
-    create_maternal_prediction_model()
-    create_simple_fetal_model()
-    create_gradient_boosting_model()
+    metrics = {
+        'simple_maternal': create_simple_maternal_model(args.plot_dir, args.show),
+        'maternal_prediction': create_maternal_prediction_model(args.plot_dir, args.show),
+        'simple_fetal': create_simple_fetal_model(args.plot_dir, args.show),
+        'gradient_boosting': create_gradient_boosting_model(),
+    }
+    if args.metrics_json:
+        with open(args.metrics_json, 'w') as f:
+            json.dump(metrics, f, indent=2)
+        print(f"Metrics written to {args.metrics_json}")
     print("\nDone! Models have been saved in the 'model' directory.")
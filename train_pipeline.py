@@ -0,0 +1,167 @@
+"""
+Reproducible training pipeline for the maternal and fetal models
+
+Trains on data/*.csv with a cross-validated hyperparameter search that runs
+on every core, and writes a versioned model artifact with a JSON metadata
+sidecar (feature order, training data hash, parameters, metrics) and the
+feature schema the app validates inputs against.
+
+Usage:
+    python train_pipeline.py                      # train both models
+    python train_pipeline.py --models maternal --promote
+"""
+import argparse
+import datetime
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import GridSearchCV, StratifiedKFold, cross_val_score, train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+from codebase.feature_schema import save_schema, schema_for, schema_path
+from codebase.tree_compiler import export_tables, file_sha256
+
+MODEL_DIR = Path("model")
+CHUNK_SIZE = 100_000
+
+PIPELINES = {
+    'maternal': {
+        'data': "data/maternal_health.csv",
+        # Same column order as the Pregnancy Risk Prediction form
+        'features': ['Age', 'DiastolicBP', 'BS', 'BodyTemp', 'HeartRate'],
+        'target': 'RiskLevel',
+        'artifact': "finalized_maternal_model.sav",
+    },
+    'fetal': {
+        'data': "data/fetal_health.csv",
+        'features': ['baseline_value', 'accelerations', 'fetal_movement', 'uterine_contractions',
+                     'light_decelerations', 'severe_decelerations', 'prolongued_decelerations',
+                     'abnormal_short_term_variability', 'mean_value_of_short_term_variability',
+                     'percentage_of_time_with_abnormal_long_term_variability'],
+        'target': 'fetal_health',
+        'artifact': "fetal_health_classifier.sav",
+    },
+}
+
+PARAM_GRID = {
+    'max_depth': [3, 4, 5, 6, 8],
+    'min_samples_leaf': [1, 5, 10, 20],
+    'criterion': ['gini', 'entropy'],
+}
+
+
+def load_training_data(path, features, target, chunk_size=CHUNK_SIZE):
+    """
+    Streams the CSV in chunks, keeping only the needed columns as float64
+    features and an integer target, and drops incomplete rows.
+    """
+    columns = features + [target]
+    X_parts, y_parts = [], []
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=chunk_size):
+        chunk = chunk.apply(pd.to_numeric, errors='coerce').dropna()
+        X_parts.append(chunk[features].to_numpy(dtype=np.float64))
+        y_parts.append(chunk[target].to_numpy().astype(np.int64))
+    return np.concatenate(X_parts), np.concatenate(y_parts)
+
+
+def train_model(name, seed=42, n_jobs=-1, cv_folds=5):
+    """Runs the hyperparameter search for one model and returns (model, metadata)"""
+    spec = PIPELINES[name]
+    X, y = load_training_data(spec['data'], spec['features'], spec['target'])
+    print(f"{name}: {len(X)} rows, {X.shape[1]} features")
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=seed, stratify=y)
+    cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=seed)
+
+    search = GridSearchCV(DecisionTreeClassifier(random_state=seed), PARAM_GRID,
+                          cv=cv, n_jobs=n_jobs, scoring='accuracy')
+    search.fit(X_train, y_train)
+    model = search.best_estimator_
+
+    cv_scores = cross_val_score(model, X, y, cv=cv, n_jobs=n_jobs)
+    metrics = {
+        'training_accuracy': float(model.score(X_train, y_train)),
+        'testing_accuracy': float(model.score(X_test, y_test)),
+        'search_cv_accuracy': float(search.best_score_),
+        'cross_validation_accuracy_mean': float(cv_scores.mean()),
+        'cross_validation_accuracy_std': float(cv_scores.std()),
+    }
+    print(f"{name}: best params {search.best_params_}")
+    print(f"{name}: Testing Accuracy: {metrics['testing_accuracy'] * 100:.2f}%, "
+          f"Cross-Validation Accuracy: {metrics['cross_validation_accuracy_mean'] * 100:.2f}%")
+
+    data_hash = file_sha256(spec['data'])
+    created_at = datetime.datetime.now(datetime.timezone.utc)
+    metadata = {
+        'model': name,
+        'version': f"{created_at.strftime('%Y%m%dT%H%M%SZ')}-{data_hash[:8]}",
+        'created_at': created_at.isoformat(),
+        'estimator': type(model).__name__,
+        'params': search.best_params_,
+        'features': spec['features'],
+        'target': spec['target'],
+        'classes': np.asarray(model.classes_).tolist(),
+        'training_data': {'path': spec['data'], 'sha256': data_hash, 'rows': int(len(X))},
+        'metrics': metrics,
+        'seed': seed,
+        'cv_folds': cv_folds,
+        'sklearn_version': sklearn.__version__,
+    }
+    return model, metadata
+
+
+def write_artifact(model, metadata, model_dir=MODEL_DIR):
+    """
+    Writes model/<name>/<version>.sav with its <version>.json metadata and
+    <version>.schema.json sidecars and returns the artifact path
+    """
+    out_dir = Path(model_dir) / metadata['model']
+    out_dir.mkdir(parents=True, exist_ok=True)
+    artifact = out_dir / f"{metadata['version']}.sav"
+    with open(artifact, 'wb') as f:
+        pickle.dump(model, f)
+    metadata = dict(metadata, artifact_sha256=file_sha256(artifact))
+    artifact.with_suffix('.json').write_text(json.dumps(metadata, indent=2))
+    save_schema(artifact, schema_for(metadata['model'], metadata['features']))
+    return artifact
+
+
+def promote(artifact, name, model_dir=MODEL_DIR):
+    """
+    Atomically replaces the model the app loads with artifact and
+    recompiles the memory-mapped tables the app prefers over the pickle
+    """
+    target = Path(model_dir) / PIPELINES[name]['artifact']
+    tmp = target.with_suffix('.sav.tmp')
+    shutil.copyfile(artifact, tmp)
+    os.replace(tmp, target)
+    shutil.copyfile(artifact.with_suffix('.json'), target.with_suffix('.json'))
+    shutil.copyfile(schema_path(artifact), schema_path(target))
+    export_tables(target)
+    return target
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the Hey Mumma models from data/*.csv")
+    parser.add_argument('--models', nargs='+', choices=sorted(PIPELINES), default=sorted(PIPELINES))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--jobs', type=int, default=-1, help="Parallel workers (-1 uses every core)")
+    parser.add_argument('--cv-folds', type=int, default=5)
+    parser.add_argument('--model-dir', default=str(MODEL_DIR))
+    parser.add_argument('--promote', action='store_true',
+                        help="Also replace the model file the app loads")
+    args = parser.parse_args()
+
+    for name in args.models:
+        model, metadata = train_model(name, seed=args.seed, n_jobs=args.jobs, cv_folds=args.cv_folds)
+        artifact = write_artifact(model, metadata, args.model_dir)
+        print(f"{name}: saved {artifact}")
+        if args.promote:
+            print(f"{name}: promoted to {promote(artifact, name, args.model_dir)}")